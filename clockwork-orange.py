@@ -1,41 +1,100 @@
 #!/usr/bin/env python
 import argparse
-import configparser
-import ctypes
+import copy
 import json
-import mimetypes
+import logging
+import os
 import random
+import shutil
 import signal
+import stat
 import subprocess
 import sys
 import tempfile
 import time
+import traceback
+from functools import lru_cache
 from pathlib import Path
-from threading import Event
-
-import requests
-import yaml
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
+from threading import Event, Lock, current_thread, main_thread
 
 import platform_utils
-from config_migrations import load_and_migrate
 from plugin_manager import PluginManager
 
-# GUI imports (optional)
-try:
-    from gui.main_window import main as gui_main
-
-    GUI_AVAILABLE = True
-except ImportError as e:
-    print(f"GUI Import Error: {e}")
-    GUI_AVAILABLE = False
+# yaml, requests, configparser, watchdog, ctypes and the GUI are imported
+# inside the functions that need them, so one-shot CLI runs don't pay for
+# loading them.
 
 # Supported image file extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp", ".svg"}
-
-# Global flag for graceful shutdown
-shutdown_requested = False
+IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp", ".svg"}
+)
+# Lower- and upper-case forms for str.endswith() checks
+_IMAGE_SUFFIXES = tuple(sorted(IMAGE_EXTENSIONS)) + tuple(
+    sorted(ext.upper() for ext in IMAGE_EXTENSIONS)
+)
+
+# Leading bytes of the raster formats we accept, for files whose name has no
+# recognised extension (e.g. ".tif", or a download saved without a suffix)
+IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"GIF87a",
+    b"GIF89a",
+    b"BM",  # BMP
+    b"II*\x00",  # TIFF, little-endian
+    b"MM\x00*",  # TIFF, big-endian
+)
+
+# Temp-file suffix for downloaded images, by Content-Type
+CONTENT_TYPE_SUFFIXES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+    "image/svg+xml": ".svg",
+}
+
+# HTTP connection pooling for URL downloads
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+# Read size when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+_SESSION = None
+
+# Wallpaper selection draws from its own Mersenne Twister, seeded once from
+# os.urandom(). Plugins running in-process can't reseed it, and tests can seed
+# it for repeatable picks. Not SystemRandom: that would syscall per draw.
+_rng = random.Random()
+
+# Cached directory scans: str(directory) -> ((st_mtime_ns, st_size), images).
+# A directory's mtime changes whenever an entry is added, removed or renamed,
+# so an unchanged signature means the previous scan is still valid.
+_DIR_CACHE = {}
+_DIR_CACHE_MAX_ENTRIES = 32
+_DIR_CACHE_LOCK = Lock()
+
+# Upper bound on sources scanned at the same time. Scans are stat()-bound,
+# which matters mostly for sources on network mounts.
+MAX_SCAN_WORKERS = 8
+
+# Set by the signal handler to request a graceful shutdown. Cycle loops block
+# on it with a timeout, so they wake immediately on Ctrl+C / SIGTERM instead of
+# polling once per second.
+shutdown_event = Event()
+
+# Set by the config watcher (and SIGHUP) to end the dynamic-mode wait early so
+# the next cycle picks up the new configuration.
+config_change_event = Event()
+
+# Last parsed config file, keyed on (path, st_mtime_ns, st_size). Dynamic
+# cycles reload the config every time; an unchanged file costs one stat()
+# instead of a read and parse. "config" holds a _freeze_config() snapshot.
+_CONFIG_CACHE = {"key": None, "config": {}}
+
+# Upper bound on plugins executed at the same time in a dynamic cycle.
+MAX_PLUGIN_WORKERS = 8
 
 # Quiet window (seconds) used to coalesce a burst of rapid config-file writes
 # into a single wallpaper switch. A flurry of writes (e.g. several config saves
@@ -43,127 +102,335 @@ shutdown_requested = False
 # per write.
 CONFIG_DEBOUNCE_SECONDS = 2.0
 
+# Default scan interval (seconds) of the polling config watcher used when
+# ~/.config is on a network share, where inotify/ReadDirectoryChangesW miss
+# remote writes. Overridable with the config_poll_interval setting.
+CONFIG_POLL_INTERVAL = 30
+
+
+# Diagnostics go through this logger with lazy %-formatting, so disabled
+# debug calls never build their message. Debug output is off by default; turn
+# it on with CO_DEBUG=1 or `debug: true` in the config file (the GUI's "Enable
+# debug logging" setting). CLOCKWORK_LOG sets the base level (default WARNING).
+log = logging.getLogger("clockwork")
+LOG_FORMAT = "[%(levelname)s] %(message)s"
+
+
+def _configure_logging():
+    """Log to stderr (stdout carries --run-plugin JSON) at the CLOCKWORK_LOG level."""
+    level = os.environ.get("CLOCKWORK_LOG", "WARNING").upper()
+    if not isinstance(logging.getLevelName(level), int):
+        level = "WARNING"
+    logging.basicConfig(format=LOG_FORMAT, level=level)
+    _apply_debug_setting({})
+
+
+def _apply_debug_setting(config: dict):
+    """Enable debug logging if the environment or config asks for it."""
+    if os.environ.get("CO_DEBUG") == "1" or config.get("debug"):
+        log.setLevel(logging.DEBUG)
+    else:
+        log.setLevel(logging.NOTSET)
+
 
 def signal_handler(signum, frame):
     """Handle interrupt signals gracefully."""
-    global shutdown_requested
-    print(f"\n[DEBUG] Received signal {signum}, shutting down gracefully...")
-    shutdown_requested = True
+    print(f"\nReceived signal {signum}, shutting down gracefully...")
+    shutdown_event.set()
+    # Also wake the dynamic-mode wait, which blocks on config changes
+    config_change_event.set()
+
+
+def reload_signal_handler(signum, frame):
+    """Handle SIGHUP: drop the cached config and run a new cycle right away."""
+    print(f"\nReceived signal {signum}, reloading configuration...")
+    _invalidate_config_cache()
+    config_change_event.set()
+
+
+def _install_signal_handlers(reload_on_hup: bool = False):
+    """Route SIGINT/SIGTERM to a graceful shutdown.
+
+    With reload_on_hup, SIGHUP (where the platform has it) forces a config
+    reload and an immediate cycle instead of terminating the process.
+
+    signal.signal() only works on the main thread. Elsewhere (e.g. a cycle
+    run from a GUI worker) this is a no-op and shutdown_event must be set by
+    the caller instead.
+    """
+    if current_thread() is not main_thread():
+        log.debug("Not on the main thread, leaving signal handlers alone")
+        return
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    if reload_on_hup and hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, reload_signal_handler)
+
+
+@lru_cache(maxsize=1)
+def _get_plugin_manager() -> PluginManager:
+    """Return the process-wide PluginManager.
+
+    Plugin discovery scans the plugins directory, so argument parsing, config
+    cleanup and plugin execution share one instance.
+    """
+    return PluginManager()
+
+
+def _get_http_session():
+    """Return the shared requests Session, creating it on first use.
+
+    The session keeps connections alive and retries transient errors, so
+    repeated cycles reuse the same TCP/TLS connection.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    _SESSION = session
+    return session
+
+
+def _has_image_suffix(name: str) -> bool:
+    """Return True if a file name ends in one of IMAGE_EXTENSIONS.
+
+    str.endswith() with a tuple runs in C without allocating; only names that
+    miss the lower/upper-case forms (non-images, or mixed case like ".Jpg")
+    pay for a lower() copy.
+    """
+    if not name.endswith(_IMAGE_SUFFIXES) and not name.lower().endswith(
+        _IMAGE_SUFFIXES
+    ):
+        return False
+    # A bare ".jpg" is a dotfile without a suffix, as far as pathlib is concerned
+    return name.rfind(".") > 0
+
+
+def is_image_file_fast(entry) -> bool:
+    """Suffix-only image check used by directory scans.
+
+    Accepts an os.DirEntry or a Path. The name is checked without building a
+    Path, and is_file() on a DirEntry is answered from the cached directory
+    record, so no extra stat() is needed.
+    """
+    return _has_image_suffix(entry.name) and entry.is_file()
 
 
 def is_image_file(file_path: Path) -> bool:
-    """Check if a file is a supported image format."""
+    """Check if a single file is a supported image format.
+
+    Falls back to sniffing the file header for files whose extension is not
+    in IMAGE_EXTENSIONS. Used for explicitly requested files; directory scans
+    use is_image_file_fast().
+    """
     if not file_path.is_file():
         return False
 
     # Check by extension first (faster)
-    if file_path.suffix.lower() in IMAGE_EXTENSIONS:
+    if _has_image_suffix(file_path.name):
         return True
 
-    # Fallback to MIME type detection
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type and mime_type.startswith("image/"):
+    return _has_image_header(file_path)
+
+
+def _has_image_header(file_path: Path) -> bool:
+    """Return True if the file starts with a known image signature."""
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(12)
+    except OSError:
+        return False
+
+    if header.startswith(IMAGE_SIGNATURES):
         return True
+    # WebP: "RIFF" <size> "WEBP"
+    return header[:4] == b"RIFF" and header[8:12] == b"WEBP"
 
-    return False
+
+def _scan_images(directory: Path, st=None) -> tuple:
+    """Return the image files directly inside a directory.
+
+    Results are cached per directory and revalidated with a single stat() of
+    the directory itself, so steady-state cycles skip the scandir walk.
+    Callers that already stat()ed the directory can pass the result as st.
+    """
+    key = str(directory)
+    if st is None:
+        st = os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size)
+
+    cached = _DIR_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with os.scandir(key) as it:
+        images = tuple(Path(entry.path) for entry in it if is_image_file_fast(entry))
+
+    # Sources may be scanned from worker threads; keep eviction consistent
+    with _DIR_CACHE_LOCK:
+        _DIR_CACHE.pop(key, None)
+        if len(_DIR_CACHE) >= _DIR_CACHE_MAX_ENTRIES:
+            # Evict the least recently scanned directory (dicts keep insertion order)
+            del _DIR_CACHE[next(iter(_DIR_CACHE))]
+        _DIR_CACHE[key] = (signature, images)
+    return images
 
 
 def get_random_image_from_directory(directory: Path) -> Path:
     """Get a random image file from the specified directory."""
-    print(f"[DEBUG] Searching for image files in directory: {directory}")
+    log.debug("Searching for image files in directory: %s", directory)
 
     if not directory.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
 
-    # List all files in directory for debugging
-    all_files = list(directory.iterdir())
-    print(f"[DEBUG] All files in directory ({len(all_files)}):")
-    for f in all_files:
-        print(f"[DEBUG]   - {f.name} (is_file: {f.is_file()}, suffix: {f.suffix})")
+    # List all files in directory for debugging. The per-file listing is
+    # skipped entirely when debug output is off, since it is O(files) per cycle.
+    # Each listing is emitted as one record, so it costs a single write.
+    # scandir's cached entry type avoids a stat() per listed file.
+    if log.isEnabledFor(logging.DEBUG):
+        with os.scandir(directory) as it:
+            all_files = [
+                f"  - {entry.name} (is_file: {entry.is_file()}, "
+                f"suffix: {Path(entry.name).suffix})"
+                for entry in it
+            ]
+        log.debug(
+            "All files in directory (%d):\n%s", len(all_files), "\n".join(all_files)
+        )
 
     # Find all image files in the directory
-    image_files = [f for f in directory.iterdir() if is_image_file(f)]
+    image_files = _scan_images(directory)
 
-    print(f"[DEBUG] Image files found ({len(image_files)}):")
-    for f in image_files:
-        print(f"[DEBUG]   - {f.name}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Image files found (%d):\n%s",
+            len(image_files),
+            "\n".join(f"  - {f.name}" for f in image_files),
+        )
 
     if not image_files:
         raise ValueError(f"No image files found in directory: {directory}")
 
-    selected_file = random.choice(image_files)
-    print(f"[DEBUG] Randomly selected: {selected_file}")
-    print(f"[DEBUG] Selected file exists: {selected_file.exists()}")
-    print(f"[DEBUG] Selected file is file: {selected_file.is_file()}")
+    selected_file = _rng.choice(image_files)
+    log.debug("Randomly selected: %s", selected_file)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Selected file exists: %s", selected_file.exists())
+        log.debug("Selected file is file: %s", selected_file.is_file())
 
     return selected_file
 
 
 def set_wallpaper(p: Path):
-    print(f"[DEBUG] Setting wallpaper from path: {p}")
-    p = p.resolve()
-    print(f"[DEBUG] Resolved absolute path: {p}")
-
-    if not p.exists():
+    log.debug("Setting wallpaper from path: %s", p)
+    # Scanned images already carry an absolute path built from a resolved
+    # source; resolve() would re-walk every component for nothing.
+    if not p.is_absolute():
+        p = p.resolve()
+        log.debug("Resolved absolute path: %s", p)
+
+    # One stat() answers both "does it exist" and "how big is it"
+    try:
+        file_size = os.stat(p).st_size
+    except OSError:
         print(f"[ERROR] File does not exist: {p}")
         return False
-
-    file_size = p.stat().st_size
-    print(f"[DEBUG] File size: {file_size} bytes")
+    log.debug("File size: %s bytes", file_size)
 
     return platform_utils.set_wallpaper(p)
 
 
+def _download_suffix(url: str, content_type: str) -> str:
+    """Pick a temp-file suffix matching the downloaded image's real format."""
+    mime = content_type.split(";", 1)[0].strip().lower()
+    if mime in CONTENT_TYPE_SUFFIXES:
+        return CONTENT_TYPE_SUFFIXES[mime]
+    # Generic or missing Content-Type: trust the URL's extension if it is one
+    url_suffix = Path(url.split("?", 1)[0]).suffix.lower()
+    if url_suffix in IMAGE_EXTENSIONS:
+        return url_suffix
+    return ".jpg"
+
+
 def download_and_set_wallpaper(url: str):
     """Download image from URL and set as wallpaper."""
-    print(f"[DEBUG] Downloading image from: {url}")
+    import requests
 
-    try:
-        response = requests.get(url, timeout=30)
-        print(f"[DEBUG] HTTP response status: {response.status_code}")
-        print(f"[DEBUG] Content length: {len(response.content)} bytes")
-        print(
-            f"[DEBUG] Content type: {response.headers.get('content-type', 'unknown')}"
-        )
+    log.debug("Downloading image from: %s", url)
 
-        if response.status_code != 200:
-            print(
-                f"[ERROR] Failed to download image. HTTP status: {response.status_code}"
+    try:
+        # Stream the body straight to disk instead of buffering it in memory
+        with _get_http_session().get(url, timeout=30, stream=True) as response:
+            log.debug("HTTP response status: %s", response.status_code)
+            log.debug(
+                "Content length: %s bytes",
+                response.headers.get("content-length", "unknown"),
             )
-            return False
+            log.debug(
+                "Content type: %s", response.headers.get("content-type", "unknown")
+            )
+
+            # Any 2xx is a body we can use; errors are reported below
+            response.raise_for_status()
+
+            # Let urllib3 undo any gzip/deflate transfer encoding
+            response.raw.decode_content = True
+
+            suffix = _download_suffix(url, response.headers.get("content-type", ""))
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as f:
+                log.debug("Created temporary file: %s", f.name)
 
+                try:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    # Size actually written; the header above may be absent or
+                    # describe the compressed transfer
+                    log.debug("Successfully wrote %s bytes to temporary file", f.tell())
+                except Exception as e:
+                    print(f"[ERROR] Failed to write image to temporary file: {e}")
+                    write_failed = True
+                else:
+                    write_failed = False
+
+            if write_failed:
+                # Don't leave a truncated download behind in the temp directory
+                Path(f.name).unlink(missing_ok=True)
+                return False
+
+    except requests.exceptions.HTTPError as e:
+        print(
+            f"[ERROR] Failed to download image. HTTP status: {e.response.status_code}"
+        )
+        return False
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Network error while downloading image: {e}")
         return False
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as f:
-        p = Path(f.name).resolve()
-        print(f"[DEBUG] Created temporary file: {p}")
-
-        try:
-            p.write_bytes(response.content)
-            print(
-                f"[DEBUG] Successfully wrote {len(response.content)} "
-                "bytes to temporary file"
-            )
-        except Exception as e:
-            print(f"[ERROR] Failed to write image to temporary file: {e}")
-            return False
-
-        return set_wallpaper(p)
+    # NamedTemporaryFile names are already absolute
+    return set_wallpaper(Path(f.name))
 
 
 def set_local_wallpaper(file_path: Path):
     """Set wallpaper from a local file."""
     file_path = file_path.resolve()
-    print(f"[DEBUG] Setting wallpaper from local file: {file_path}")
-
-    if not file_path.exists():
-        print(f"[ERROR] File does not exist: {file_path}")
-        return False
+    log.debug("Setting wallpaper from local file: %s", file_path)
 
     if not is_image_file(file_path):
-        print(f"[ERROR] File is not a supported image format: {file_path}")
+        # Only work out which check failed when one did
+        if not file_path.exists():
+            print(f"[ERROR] File does not exist: {file_path}")
+        else:
+            print(f"[ERROR] File is not a supported image format: {file_path}")
         return False
 
     return set_wallpaper(file_path)
@@ -171,76 +438,119 @@ def set_local_wallpaper(file_path: Path):
 
 def get_random_image_from_sources(sources: list) -> Path:
     """Get a random image, fairly selecting between sources first."""
-    print(f"[DEBUG] Selecting from {len(sources)} sources...")
-
-    valid_sources = _gather_valid_sources(sources)
+    image = get_n_random_images_from_sources(sources, 1)[0]
+    log.debug("Selected image: %s", image)
+    return image
 
-    if not valid_sources:
-        raise ValueError("No valid sources found")
 
-    # Shuffle to pick a random source order
-    random.shuffle(valid_sources)
+@lru_cache(maxsize=16)
+def _resolve_sources(sources: tuple) -> tuple:
+    """Resolve source paths, cached on the tuple of configured paths.
 
-    for source in valid_sources:
-        candidate = _select_candidate_from_source(source)
-        if candidate:
-            print(f"[DEBUG] Selected image from source {source}: {candidate}")
-            return candidate
+    Resolving follows every symlink component, which is slow on network
+    mounts. The configured sources rarely change, so each distinct list is
+    resolved once per process; a changed config produces a new cache key.
+    """
+    return tuple(Path(s).resolve() for s in sources)
 
-    raise ValueError(
-        f"No image files found in any of the {len(valid_sources)} provided sources"
-    )
 
+def _source_candidates(source: Path):
+    """Return every image candidate a single source can provide.
 
-def _gather_valid_sources(sources: list) -> list:
-    """Resolve and filter valid source paths."""
-    valid_sources = []
-    for s in sources:
-        path = Path(s).resolve()
-        if path.exists():
-            valid_sources.append(path)
-        else:
-            print(f"[WARN] Source does not exist: {path}")
-    return valid_sources
-
+    Returns None if the source does not exist. A single stat() tells files
+    from directories and revalidates the directory scan cache, so an
+    unchanged source costs one syscall per cycle.
+    """
+    try:
+        st = os.stat(source)
+    except OSError:
+        print(f"[WARN] Source does not exist: {source}")
+        return None
 
-def _select_candidate_from_source(source: Path):
-    """Attempt to find an image candidate from a single source."""
-    if source.is_file():
-        if is_image_file(source):
-            return source
-    elif source.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         try:
-            candidates = [f for f in source.iterdir() if is_image_file(f)]
-            if candidates:
-                return random.choice(candidates)
+            return _scan_images(source, st)
         except Exception as e:
             print(f"[ERROR] Failed to scan {source}: {e}")
-    return None
+    elif stat.S_ISREG(st.st_mode):
+        if _has_image_suffix(source.name) or _has_image_header(source):
+            return (source,)
+    return ()
+
+
+def _scan_sources(sources) -> list:
+    """Return the candidate tuples of the given sources, None if missing.
+
+    Sources are scanned concurrently, so slow stat() calls on separate
+    mounts overlap instead of adding up. Results keep source order.
+    """
+    if len(sources) == 1:
+        pools = [_source_candidates(sources[0])]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(MAX_SCAN_WORKERS, len(sources))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            pools = list(ex.map(_source_candidates, sources))
+
+    return pools
+
+
+def get_n_random_images_from_sources(sources: list, n: int) -> list:
+    """Get n random images from sources, unique whenever enough exist.
+
+    Each source is scanned once per call. Sources are still picked fairly:
+    every slot first goes to a random source that has images left, so a
+    large directory does not crowd out a small one. If the sources hold
+    fewer than n images, some images are repeated.
+    """
+    log.debug("Selecting %s images from %s sources...", n, len(sources))
+
+    results = _scan_sources(_resolve_sources(tuple(str(s) for s in sources)))
+    valid_pools = [pool for pool in results if pool is not None]
+    if not valid_pools:
+        raise ValueError("No valid sources found")
+
+    pools = [pool for pool in valid_pools if pool]
+    if not pools:
+        raise ValueError(
+            f"No image files found in any of the {len(valid_pools)} provided sources"
+        )
+
+    total = sum(len(pool) for pool in pools)
+    if total < n:
+        print(
+            f"[WARN] Only {total} image(s) available for {n} slots, some will repeat"
+        )
+        everything = [img for pool in pools for img in pool]
+        _rng.shuffle(everything)
+        return everything + _rng.choices(everything, k=n - total)
+
+    # Decide how many images each source contributes, then sample without
+    # replacement from each one.
+    counts = [0] * len(pools)
+    open_slots = list(range(len(pools)))
+    for _ in range(n):
+        i = _rng.choice(open_slots)
+        counts[i] += 1
+        if counts[i] == len(pools[i]):
+            open_slots.remove(i)
+
+    images = []
+    for pool, count in zip(pools, counts):
+        if count:
+            images.extend(_rng.sample(pool, count))
+    _rng.shuffle(images)
+    return images
 
 
 def set_random_wallpaper_from_sources(sources: list):
     """Set wallpaper from random images in the specified sources (one per monitor)."""
     try:
         monitor_count = platform_utils.get_monitor_count()
-        images = []
 
-        # Try to get unique images for each monitor
-        for _ in range(monitor_count):
-            try:
-                img = get_random_image_from_sources(sources)
-                # Simple check to avoid duplicates if we have enough images
-                attempts = 0
-                while img in images and attempts < 5:
-                    img = get_random_image_from_sources(sources)
-                    attempts += 1
-                images.append(img)
-            except ValueError:
-                break
-
-        if not images:
-            print("[ERROR] No images found in sources")
-            return False
+        # One unique image per monitor, from a single scan of the sources
+        images = get_n_random_images_from_sources(sources, monitor_count)
 
         # Use multi-monitor function if we have multiple images
         if len(images) > 1:
@@ -259,19 +569,15 @@ def set_random_wallpaper_from_directory(directory_path: Path):
 
 def cycle_wallpapers_from_sources(sources: list, wait_seconds: int):
     """Continuously cycle through random wallpapers from sources with wait intervals."""
-    print(f"[DEBUG] Starting continuous wallpaper cycling from {len(sources)} sources")
-    print(f"[DEBUG] Wait interval: {wait_seconds} seconds")
-    print(f"[DEBUG] Press Ctrl+C to stop")
-
-    # Set up signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    log.debug("Starting continuous wallpaper cycling from %s sources", len(sources))
+    log.debug("Wait interval: %s seconds", wait_seconds)
+    log.debug("Press Ctrl+C to stop")
 
     cycle_count = 0
 
-    while not shutdown_requested:
+    while not shutdown_event.is_set():
         cycle_count += 1
-        print(f"[DEBUG] Cycle #{cycle_count}")
+        log.debug("Cycle #%s", cycle_count)
 
         # Re-resolve dynamic sources here?
         # User said: "when the checkbox... is enabled/disabled... the directory... will be added/removed".
@@ -285,21 +591,18 @@ def cycle_wallpapers_from_sources(sources: list, wait_seconds: int):
         try:
             success = set_random_wallpaper_from_sources(sources)
             if success:
-                print(f"[DEBUG] Wallpaper set successfully (cycle #{cycle_count})")
+                log.debug("Wallpaper set successfully (cycle #%s)", cycle_count)
             else:
                 print(f"[ERROR] Failed to set wallpaper (cycle #{cycle_count})")
         except Exception as e:
             print(f"[ERROR] Unexpected error during cycle #{cycle_count}: {e}")
 
-        if not shutdown_requested:
-            print(f"[DEBUG] Waiting {wait_seconds} seconds before next cycle...")
-            # Sleep in small increments to be responsive to interrupts
-            for _ in range(wait_seconds):
-                if shutdown_requested:
-                    break
-                time.sleep(1)
+        if not shutdown_event.is_set():
+            log.debug("Waiting %s seconds before next cycle...", wait_seconds)
+            # Returns early as soon as a shutdown signal arrives
+            shutdown_event.wait(timeout=wait_seconds)
 
-    print(f"[DEBUG] Wallpaper cycling stopped after {cycle_count} cycles")
+    log.debug("Wallpaper cycling stopped after %s cycles", cycle_count)
 
 
 def cycle_wallpapers_from_directory(directory_path: Path, wait_seconds: int):
@@ -308,17 +611,18 @@ def cycle_wallpapers_from_directory(directory_path: Path, wait_seconds: int):
 
 def set_lockscreen_wallpaper(image_path: Path):
     """Set lock screen wallpaper."""
-    print(f"[DEBUG] set_lockscreen_wallpaper called with: {image_path}")
-
-    image_path = image_path.resolve()
-    print(f"[DEBUG] Resolved path: {image_path}")
+    log.debug("set_lockscreen_wallpaper called with: %s", image_path)
 
-    if not image_path.exists():
-        print(f"[ERROR] Image file does not exist: {image_path}")
-        return False
+    if not image_path.is_absolute():
+        image_path = image_path.resolve()
+        log.debug("Resolved path: %s", image_path)
 
     if not is_image_file(image_path):
-        print(f"[ERROR] File is not a supported image format: {image_path}")
+        # Only work out which check failed when one did
+        if not image_path.exists():
+            print(f"[ERROR] Image file does not exist: {image_path}")
+        else:
+            print(f"[ERROR] File is not a supported image format: {image_path}")
         return False
 
     return platform_utils.set_lockscreen_wallpaper(image_path)
@@ -336,27 +640,24 @@ def set_lockscreen_random_from_directory(directory_path: Path):
 
 def cycle_lockscreen_wallpapers_from_directory(directory_path: Path, wait_seconds: int):
     """Continuously cycle through random lock screen wallpapers from directory with wait intervals."""
-    print(
-        f"[DEBUG] Starting continuous lock screen wallpaper cycling from directory: {directory_path}"
+    log.debug(
+        "Starting continuous lock screen wallpaper cycling from directory: %s",
+        directory_path,
     )
-    print(f"[DEBUG] Wait interval: {wait_seconds} seconds")
-    print(f"[DEBUG] Press Ctrl+C to stop")
-
-    # Set up signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    log.debug("Wait interval: %s seconds", wait_seconds)
+    log.debug("Press Ctrl+C to stop")
 
     cycle_count = 0
 
-    while not shutdown_requested:
+    while not shutdown_event.is_set():
         cycle_count += 1
-        print(f"[DEBUG] Lock screen cycle #{cycle_count}")
+        log.debug("Lock screen cycle #%s", cycle_count)
 
         try:
             success = set_lockscreen_random_from_directory(directory_path)
             if success:
-                print(
-                    f"[DEBUG] Lock screen wallpaper set successfully (cycle #{cycle_count})"
+                log.debug(
+                    "Lock screen wallpaper set successfully (cycle #%s)", cycle_count
                 )
             else:
                 print(
@@ -367,92 +668,27 @@ def cycle_lockscreen_wallpapers_from_directory(directory_path: Path, wait_second
                 f"[ERROR] Unexpected error during lock screen cycle #{cycle_count}: {e}"
             )
 
-        if not shutdown_requested:
-            print(
-                f"[DEBUG] Waiting {wait_seconds} seconds before next lock screen cycle..."
+        if not shutdown_event.is_set():
+            log.debug(
+                "Waiting %s seconds before next lock screen cycle...", wait_seconds
             )
-            # Sleep in small increments to be responsive to interrupts
-            for _ in range(wait_seconds):
-                if shutdown_requested:
-                    break
-                time.sleep(1)
-
-    print(f"[DEBUG] Lock screen wallpaper cycling stopped after {cycle_count} cycles")
+            # Returns early as soon as a shutdown signal arrives
+            shutdown_event.wait(timeout=wait_seconds)
 
-
-def get_two_different_images_from_directory(directory: Path):
-    """Get two different random image files from the specified directory."""
-    print(f"[DEBUG] Searching for image files in directory: {directory}")
-
-    if not directory.is_dir():
-        raise ValueError(f"Path is not a directory: {directory}")
-
-    # Find all image files in the directory
-    image_files = [f for f in directory.iterdir() if is_image_file(f)]
-
-    print(f"[DEBUG] Found {len(image_files)} image files")
-
-    if len(image_files) < 2:
-        raise ValueError(
-            f"Need at least 2 image files in directory, found {len(image_files)}: {directory}"
-        )
-
-    # Select two different images
-    selected_files = random.sample(image_files, 2)
-    print(f"[DEBUG] Selected two different images:")
-    print(f"[DEBUG]   - Image 1: {selected_files[0]}")
-    print(f"[DEBUG]   - Image 2: {selected_files[1]}")
-
-    return selected_files[0], selected_files[1]
+    log.debug("Lock screen wallpaper cycling stopped after %s cycles", cycle_count)
 
 
 def set_dual_wallpapers_from_directory(directory_path: Path):
     """Set both desktop and lock screen wallpapers from different random images in directory."""
-    try:
-        monitor_count = platform_utils.get_monitor_count()
-        desktop_images = []
-
-        # Get one image per monitor for desktop
-        for _ in range(monitor_count):
-            img = get_random_image_from_sources([directory_path])
-            attempts = 0
-            while img in desktop_images and attempts < 5:
-                img = get_random_image_from_sources([directory_path])
-                attempts += 1
-            desktop_images.append(img)
-
-        # Get lockscreen image (different from desktop)
-        lockscreen_image = get_random_image_from_sources([directory_path])
-        attempts = 0
-        while lockscreen_image in desktop_images and attempts < 5:
-            lockscreen_image = get_random_image_from_sources([directory_path])
-            attempts += 1
-
-        # Set desktop wallpaper(s)
-        if len(desktop_images) > 1:
-            print(
-                f"[DEBUG] Setting desktop wallpapers (multi-monitor): {desktop_images}"
-            )
-            desktop_success = platform_utils.set_wallpaper_multi_monitor(desktop_images)
-        else:
-            print(f"[DEBUG] Setting desktop wallpaper: {desktop_images[0]}")
-            desktop_success = set_wallpaper(desktop_images[0])
-
-        print(f"[DEBUG] Setting lock screen wallpaper: {lockscreen_image}")
-        lockscreen_success = set_lockscreen_wallpaper(lockscreen_image)
-
-        return desktop_success and lockscreen_success
-    except ValueError as e:
-        print(f"[ERROR] {e}")
-        return False
+    return set_dual_wallpaper_from_sources([directory_path])
 
 
 def set_dual_wallpapers_from_files(desktop_file: Path, lockscreen_file: Path):
     """Set both desktop and lock screen wallpapers from specific files."""
-    print(f"[DEBUG] Setting desktop wallpaper: {desktop_file}")
+    log.debug("Setting desktop wallpaper: %s", desktop_file)
     desktop_success = set_wallpaper(desktop_file)
 
-    print(f"[DEBUG] Setting lock screen wallpaper: {lockscreen_file}")
+    log.debug("Setting lock screen wallpaper: %s", lockscreen_file)
     lockscreen_success = set_lockscreen_wallpaper(lockscreen_file)
 
     return desktop_success and lockscreen_success
@@ -460,28 +696,22 @@ def set_dual_wallpapers_from_files(desktop_file: Path, lockscreen_file: Path):
 
 def cycle_dual_wallpapers_from_directory(directory_path: Path, wait_seconds: int):
     """Continuously cycle through different random wallpapers for both desktop and lock screen."""
-    print(
-        f"[DEBUG] Starting continuous dual wallpaper cycling from directory: {directory_path}"
+    log.debug(
+        "Starting continuous dual wallpaper cycling from directory: %s", directory_path
     )
-    print(f"[DEBUG] Wait interval: {wait_seconds} seconds")
-    print(f"[DEBUG] Press Ctrl+C to stop")
-
-    # Set up signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    log.debug("Wait interval: %s seconds", wait_seconds)
+    log.debug("Press Ctrl+C to stop")
 
     cycle_count = 0
 
-    while not shutdown_requested:
+    while not shutdown_event.is_set():
         cycle_count += 1
-        print(f"[DEBUG] Dual wallpaper cycle #{cycle_count}")
+        log.debug("Dual wallpaper cycle #%s", cycle_count)
 
         try:
             success = set_dual_wallpapers_from_directory(directory_path)
             if success:
-                print(
-                    f"[DEBUG] Both wallpapers set successfully (cycle #{cycle_count})"
-                )
+                log.debug("Both wallpapers set successfully (cycle #%s)", cycle_count)
             else:
                 print(
                     f"[ERROR] Failed to set one or both wallpapers (cycle #{cycle_count})"
@@ -491,17 +721,14 @@ def cycle_dual_wallpapers_from_directory(directory_path: Path, wait_seconds: int
                 f"[ERROR] Unexpected error during dual wallpaper cycle #{cycle_count}: {e}"
             )
 
-        if not shutdown_requested:
-            print(
-                f"[DEBUG] Waiting {wait_seconds} seconds before next dual wallpaper cycle..."
+        if not shutdown_event.is_set():
+            log.debug(
+                "Waiting %s seconds before next dual wallpaper cycle...", wait_seconds
             )
-            # Sleep in small increments to be responsive to interrupts
-            for _ in range(wait_seconds):
-                if shutdown_requested:
-                    break
-                time.sleep(1)
+            # Returns early as soon as a shutdown signal arrives
+            shutdown_event.wait(timeout=wait_seconds)
 
-    print(f"[DEBUG] Dual wallpaper cycling stopped after {cycle_count} cycles")
+    log.debug("Dual wallpaper cycling stopped after %s cycles", cycle_count)
 
 
 def load_config_file():
@@ -513,70 +740,113 @@ def load_config_file():
         config_paths.append(Path("C:/Users/Public/clockwork_config.yml"))  # Shared config for service
 
     for config_path in config_paths:
-        if config_path.exists():
-            try:
-                print(f"[DEBUG] Loading configuration from {config_path}")
-                return load_and_migrate(config_path)
-            except Exception as e:
-                print(f"[ERROR] Failed to load config file {config_path}: {e}")
+        try:
+            st = config_path.stat()
+        except OSError:
+            continue
+
+        # Callers such as clean_config mutate the config, so hand out copies
+        # and keep the cached parse pristine.
+        key = (config_path, st.st_mtime_ns, st.st_size)
+        if _CONFIG_CACHE["key"] == key:
+            return _thaw_config(_CONFIG_CACHE["config"])
+
+        try:
+            log.debug("Loading configuration from %s", config_path)
+            from config_migrations import load_and_migrate
+
+            config = load_and_migrate(config_path)
+        except Exception as e:
+            print(f"[ERROR] Failed to load config file {config_path}: {e}")
+            continue
+
+        _CONFIG_CACHE.update(key=key, config=_freeze_config(config))
+        return config
 
     # Defaults handled by caller
     return {}
 
 
+def _invalidate_config_cache():
+    """Force the next load_config_file() call to re-read the file.
+
+    The (mtime, size) key misses an edit that keeps the size and lands within
+    the filesystem's timestamp granularity, so anything that knows the file
+    changed (the config watcher, SIGHUP) drops the cache explicitly.
+    """
+    _CONFIG_CACHE["key"] = None
+
+
+def _freeze_config(config: dict):
+    """Return a snapshot of a parsed config that is cheap to copy back out.
+
+    Configs are almost always plain JSON data, and json.loads() rebuilds one
+    about three times faster than copy.deepcopy() copies it. Anything JSON
+    can't round-trip (YAML dates, non-string keys) is deep-copied instead.
+    """
+    try:
+        text = json.dumps(config)
+    except (TypeError, ValueError):
+        return copy.deepcopy(config)
+    if json.loads(text) != config:
+        return copy.deepcopy(config)
+    return text
+
+
+def _thaw_config(snapshot) -> dict:
+    """Return a fresh, caller-owned config from a _freeze_config() snapshot."""
+    if isinstance(snapshot, str):
+        return json.loads(snapshot)
+    return copy.deepcopy(snapshot)
+
+
 def merge_config_with_args(config, args):
     """Merge configuration file options with command line arguments."""
-    print(f"[DEBUG] Merging configuration with command line arguments")
+    log.debug("Merging configuration with command line arguments")
 
     # Create a copy of args to avoid modifying the original
     merged_args = argparse.Namespace(**vars(args))
 
     # Apply configuration defaults if not specified on command line
-    if hasattr(config, "get"):
-        # Desktop wallpaper settings
-        if (
-            not merged_args.desktop
-            and not merged_args.lockscreen
-            and config.get("desktop", False)
-        ):
-            merged_args.desktop = True
-            print(f"[DEBUG] Enabled desktop mode from config")
+    if not isinstance(config, dict):
+        return merged_args
 
-        # Lock screen settings
-        if (
-            not merged_args.lockscreen
-            and not merged_args.desktop
-            and config.get("lockscreen", False)
-        ):
-            merged_args.lockscreen = True
-            print(f"[DEBUG] Enabled lock screen mode from config")
-
-        # Dual wallpaper settings
-        if config.get("dual_wallpapers", False):
-            merged_args.desktop = True
-            merged_args.lockscreen = True
-            print(f"[DEBUG] Enabled dual wallpaper mode from config")
-
-        # Default wait interval (only if wait not specified)
-        if not merged_args.wait:
-            if config.get("default_wait"):
-                merged_args.wait = config["default_wait"]
-                print(
-                    f"[DEBUG] Set default wait interval from config: {merged_args.wait}"
-                )
-            elif merged_args.service:
-                # Service mode fallback default
-                merged_args.wait = 900
-                print(f"[DEBUG] Service mode: defaulting to 900s wait interval")
-
-        # Default plugin
-        # Default plugin
-        # We do NOT want to force a single plugin here.
-        # If no plugin is specified, we want 'main' to detect this and enter Multi-Plugin Mode.
-        # So we remove the fallback logic entirely.
-        pass
+    # Desktop wallpaper settings
+    if (
+        not merged_args.desktop
+        and not merged_args.lockscreen
+        and config.get("desktop", False)
+    ):
+        merged_args.desktop = True
+        log.debug("Enabled desktop mode from config")
 
-    return merged_args
+    # Lock screen settings
+    if (
+        not merged_args.lockscreen
+        and not merged_args.desktop
+        and config.get("lockscreen", False)
+    ):
+        merged_args.lockscreen = True
+        log.debug("Enabled lock screen mode from config")
+
+    # Dual wallpaper settings
+    if config.get("dual_wallpapers", False):
+        merged_args.desktop = True
+        merged_args.lockscreen = True
+        log.debug("Enabled dual wallpaper mode from config")
+
+    # Default wait interval (only if wait not specified)
+    if not merged_args.wait:
+        if config.get("default_wait"):
+            merged_args.wait = config["default_wait"]
+            log.debug("Set default wait interval from config: %s", merged_args.wait)
+        elif merged_args.service:
+            # Service mode fallback default
+            merged_args.wait = 900
+            log.debug("Service mode: defaulting to 900s wait interval")
+
+    # No default plugin: if none is specified, main() detects this and
+    # enters Multi-Plugin Mode.
 
     return merged_args
 
@@ -584,7 +854,7 @@ def merge_config_with_args(config, args):
 def write_config_file(args):
     """Write configuration file based on current command line arguments."""
     config_path = Path.home() / ".config" / "clockwork-orange.yml"
-    print(f"[DEBUG] Writing configuration file to: {config_path}")
+    log.debug("Writing configuration file to: %s", config_path)
 
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -596,8 +866,9 @@ def write_config_file(args):
         config["default_wait"] = args.wait
 
     try:
-        with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=True)
+        from config_migrations import save_config
+
+        save_config(config, config_path)
         return True
     except Exception as e:
         print(f"[ERROR] Failed to write configuration file: {e}")
@@ -631,105 +902,152 @@ def debug_lockscreen_config():
     config_path = Path.home() / ".config" / "kscreenlockerrc"
 
     if not config_path.exists():
-        print(f"[DEBUG] Configuration file does not exist: {config_path}")
+        print(f"Configuration file does not exist: {config_path}")
         return
 
     try:
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        _print_config_sections(config)
-        _check_lockscreen_wallpaper_setting(config)
-        _check_greeter_wallpaper_setting(config)
+        sections = _read_kde_config(config_path)
     except Exception as e:
         print(f"[ERROR] Failed to read configuration file: {e}")
+        return
 
+    _print_config_sections(sections)
+    _check_lockscreen_wallpaper_setting(sections)
+    _check_greeter_wallpaper_setting(sections)
 
-def _print_config_sections(config):
-    print(f"[DEBUG] Configuration sections found:")
-    for section in config.sections():
-        print(f"[DEBUG]   - {section}")
-        for key, value in config.items(section):
-            print(f"[DEBUG]     {key} = {value}")
 
+def _read_kde_config(config_path: Path) -> dict:
+    """Read a KDE config file into {group: {key: value}} in a single pass.
 
-def _check_lockscreen_wallpaper_setting(config):
-    wallpaper_section = "Greeter][Wallpaper][org.kde.image][General"
-    if config.has_section(wallpaper_section):
-        if config.has_option(wallpaper_section, "Image"):
-            print(
-                f"[DEBUG] Current lock screen wallpaper: {config.get(wallpaper_section, 'Image')}"
-            )
-        elif config.has_option(wallpaper_section, "image"):
-            print(
-                f"[DEBUG] Current lock screen wallpaper: {config.get(wallpaper_section, 'image')}"
-            )
-        else:
-            print(f"[DEBUG] No Image key found in {wallpaper_section}")
+    Nested groups keep KDE's spelling, e.g. "Greeter][Wallpaper". Unlike
+    configparser this tolerates repeated keys (the last one wins) and keeps
+    key case, so "Image" and "image" stay distinguishable.
+    """
+    sections = {}
+    current = None
+    with open(config_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line[0] == "[" and line[-1] == "]":
+                current = sections.setdefault(line[1:-1], {})
+            elif current is not None and "=" in line:
+                key, _, value = line.partition("=")
+                current[key.strip()] = value.strip()
+    return sections
+
+
+def _print_config_sections(sections):
+    # The --debug-lockscreen report is what the user asked for, so these
+    # helpers print it whatever the debug setting
+    print("Configuration sections found:")
+    for section, entries in sections.items():
+        print(f"  - {section}")
+        for key, value in entries.items():
+            print(f"    {key} = {value}")
+
+
+def _check_lockscreen_wallpaper_setting(sections):
+    wallpaper_section = platform_utils.KSCREENLOCKER_IMAGE_GROUP
+    entries = sections.get(wallpaper_section)
+    if entries is None:
+        print(f"Wallpaper section {wallpaper_section} not found")
+    elif "Image" in entries or "image" in entries:
+        print(
+            f"Current lock screen wallpaper: {entries.get('Image', entries.get('image'))}"
+        )
     else:
-        print(f"[DEBUG] Wallpaper section {wallpaper_section} not found")
+        print(f"No Image key found in {wallpaper_section}")
 
 
-def _check_greeter_wallpaper_setting(config):
-    if config.has_section("Greeter") and config.has_option("Greeter", "wallpaper"):
-        print(f"[DEBUG] Main Greeter wallpaper: {config.get('Greeter', 'wallpaper')}")
+def _check_greeter_wallpaper_setting(sections):
+    greeter = sections.get("Greeter", {})
+    if "wallpaper" in greeter:
+        print(f"Main Greeter wallpaper: {greeter['wallpaper']}")
     else:
-        print(f"[DEBUG] No wallpaper key found in Greeter section")
+        print("No wallpaper key found in Greeter section")
+
+
+def _run_plugin_for_source(plugin_manager, name, plugin_cfg):
+    """Run one plugin and return its source path, or None on failure."""
+    try:
+        result = plugin_manager.execute_plugin(name, plugin_cfg)
+        if result.get("status") == "success":
+            path = result.get("path")
+            if path:
+                return Path(path)
+    except Exception as e:
+        print(f"[ERROR] Failed to execute plugin {name}: {e}")
+    return None
+
+
+def enabled_plugin_configs(config) -> dict:
+    """Return {name: plugin_config} for the enabled plugins, in config order."""
+    return {
+        name: plugin_cfg
+        for name, plugin_cfg in (config.get("plugins") or {}).items()
+        if plugin_cfg.get("enabled", False)
+    }
+
+
+def has_enabled_plugins(config) -> bool:
+    """Return True if any plugin is enabled, stopping at the first one."""
+    return any(
+        plugin_cfg.get("enabled", False)
+        for plugin_cfg in (config.get("plugins") or {}).values()
+    )
 
 
 def collect_plugin_sources(config, plugin_manager):
-    """Collect source paths from all enabled plugins."""
-    sources = []
-    plugins_config = config.get("plugins", {})
+    """Collect source paths from all enabled plugins.
 
-    for name, plugin_cfg in plugins_config.items():
-        if plugin_cfg.get("enabled", False):
-            # print(f"[DEBUG] Processing enabled plugin: {name}")
-            try:
-                result = plugin_manager.execute_plugin(name, plugin_cfg)
-                if result.get("status") == "success":
-                    path = result.get("path")
-                    if path:
-                        sources.append(Path(path))
-            except Exception as e:
-                print(f"[ERROR] Failed to execute plugin {name}: {e}")
+    Each plugin runs as its own subprocess and mostly waits on network or
+    disk, so enabled plugins run concurrently. Sources keep config order.
+    """
+    enabled = list(enabled_plugin_configs(config).items())
+    if not enabled:
+        return []
 
-    return sources
+    if len(enabled) == 1:
+        paths = [_run_plugin_for_source(plugin_manager, *enabled[0])]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # No per-plugin timeout: image generation plugins legitimately take
+        # minutes, and execute_plugin already reports its own failures.
+        workers = min(MAX_PLUGIN_WORKERS, len(enabled))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            paths = list(
+                ex.map(
+                    lambda item: _run_plugin_for_source(plugin_manager, *item),
+                    enabled,
+                )
+            )
+
+    return [path for path in paths if path]
 
 
 def set_dual_wallpaper_from_sources(sources: list):
     """Set both desktop and lock screen wallpapers from different random images in sources."""
     try:
         monitor_count = platform_utils.get_monitor_count()
-        desktop_images = []
-
-        # Get one image per monitor for desktop
-        for _ in range(monitor_count):
-            img = get_random_image_from_sources(sources)
-            # Try to avoid duplicates
-            attempts = 0
-            while img in desktop_images and attempts < 5:
-                img = get_random_image_from_sources(sources)
-                attempts += 1
-            desktop_images.append(img)
 
-        # Get one image for lockscreen (different from desktop images)
-        lockscreen_image = get_random_image_from_sources(sources)
-        attempts = 0
-        while lockscreen_image in desktop_images and attempts < 5:
-            lockscreen_image = get_random_image_from_sources(sources)
-            attempts += 1
+        # One image per monitor plus one for the lock screen, all different
+        # when the sources hold enough images
+        *desktop_images, lockscreen_image = get_n_random_images_from_sources(
+            sources, monitor_count + 1
+        )
 
         # Set desktop wallpaper(s)
         if len(desktop_images) > 1:
-            print(
-                f"[DEBUG] Setting desktop wallpapers (multi-monitor): {desktop_images}"
-            )
+            log.debug("Setting desktop wallpapers (multi-monitor): %s", desktop_images)
             desktop_success = platform_utils.set_wallpaper_multi_monitor(desktop_images)
         else:
-            print(f"[DEBUG] Setting desktop wallpaper: {desktop_images[0]}")
+            log.debug("Setting desktop wallpaper: %s", desktop_images[0])
             desktop_success = set_wallpaper(desktop_images[0])
 
-        print(f"[DEBUG] Setting lock screen wallpaper: {lockscreen_image}")
+        log.debug("Setting lock screen wallpaper: %s", lockscreen_image)
         lockscreen_success = set_lockscreen_wallpaper(lockscreen_image)
 
         return desktop_success and lockscreen_success
@@ -745,88 +1063,141 @@ def cycle_dynamic_plugins(
     lockscreen: bool = False,
 ):
     """Continuously cycle wallpapers using enabled plugins, reloading config each time."""
-    print(f"[DEBUG] Starting dynamic plugin cycling")
-    print(f"[DEBUG] Wait interval: {wait_seconds} seconds")
-    print(f"[DEBUG] Desktop: {desktop}, Lockscreen: {lockscreen}")
-    print(f"[DEBUG] Press Ctrl+C to stop")
+    log.debug("Starting dynamic plugin cycling")
+    log.debug("Wait interval: %s seconds", wait_seconds)
+    log.debug("Desktop: %s, Lockscreen: %s", desktop, lockscreen)
+    log.debug("Press Ctrl+C to stop")
 
-    # Initialize Watchdog
     config_path = Path.home() / ".config" / "clockwork-orange.yml"
-    config_change_event = Event()
-    observer = Observer()
+    config_change_event.clear()
     watcher = ConfigWatcher(config_path, config_change_event)
 
     # Ensure config dir exists
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    observer.schedule(watcher, str(config_path.parent), recursive=False)
+    observer = _create_config_observer(
+        config_path.parent, _config_poll_interval(load_config_file())
+    )
+    _schedule_config_watcher(observer, watcher, config_path.parent)
     observer.start()
-    print(f"[DEBUG] Started configuration watcher on {config_path}")
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    log.debug("Started configuration watcher on %s", config_path)
 
     cycle_count = 0
 
     try:
-        while not shutdown_requested:
+        while not shutdown_event.is_set():
             cycle_count += 1
-            print(f"[DEBUG] Cycle #{cycle_count}")
+            log.debug("Cycle #%s", cycle_count)
 
             # Execute one cycle
             config = _execute_dynamic_cycle(plugin_manager, desktop, lockscreen)
 
-            if not shutdown_requested:
+            if not shutdown_event.is_set():
                 _wait_for_next_cycle(config, wait_seconds, config_change_event)
     finally:
         observer.stop()
         observer.join()
-        print(f"[DEBUG] Watcher stopped")
+        log.debug("Watcher stopped")
+
+    log.debug("Dynamic cycling stopped")
+
+
+def _config_poll_interval(config) -> float:
+    """Return the configured polling-watcher interval in seconds."""
+    value = config.get("config_poll_interval", CONFIG_POLL_INTERVAL)
+    try:
+        interval = float(value)
+    except (ValueError, TypeError):
+        interval = 0
+    if interval <= 0:
+        print(
+            f"[WARN] Invalid config_poll_interval {value!r}, "
+            f"using {CONFIG_POLL_INTERVAL}s"
+        )
+        return CONFIG_POLL_INTERVAL
+    return interval
+
+
+def _create_config_observer(config_dir: Path, poll_interval=CONFIG_POLL_INTERVAL):
+    """Return a watchdog observer suited to the filesystem holding config_dir.
+
+    Native observers don't see writes made by other machines to a network
+    share, so those fall back to polling the directory every poll_interval
+    seconds. Config files change at human timescales, so a long interval
+    keeps the idle stat() load low.
+    """
+    if platform_utils.is_network_path(config_dir):
+        from watchdog.observers.polling import PollingObserver
 
-    print(f"[DEBUG] Dynamic cycling stopped")
+        log.debug(
+            "%s is on a network share, polling every %ss", config_dir, poll_interval
+        )
+        return PollingObserver(timeout=poll_interval)
+
+    from watchdog.observers import Observer
+
+    return Observer()
 
 
-def clean_config(config):
+def _schedule_config_watcher(observer, watcher, config_dir: Path):
+    """Watch config_dir with watcher, filtering events where watchdog can.
+
+    event_filter is new in watchdog 4.0. Older releases (as packaged by some
+    distributions) reject the keyword, and get every event instead; dispatch()
+    still ignores everything but the config file.
+    """
+    try:
+        observer.schedule(
+            watcher,
+            str(config_dir),
+            recursive=False,
+            event_filter=watcher.event_filter(),
+        )
+    except TypeError:
+        log.debug("watchdog has no event_filter support, watching unfiltered")
+        observer.schedule(watcher, str(config_dir), recursive=False)
+
+
+def clean_config(config, plugin_manager=None):
     """Clean up invalid plugins from configuration."""
     if not config.get("plugins"):
         return
 
-    plugin_manager = PluginManager()
-    available = plugin_manager.get_available_plugins()
+    if plugin_manager is None:
+        plugin_manager = _get_plugin_manager()
+    available = frozenset(plugin_manager.get_available_plugins())
 
     plugins = config["plugins"]
-    to_remove = []
-
-    for name in plugins:
-        if name not in available:
-            to_remove.append(name)
+    # Hashed membership; a list comprehension keeps config order for the log
+    to_remove = [name for name in plugins if name not in available]
 
     if to_remove:
-        print(
-            f"[DEBUG] Cleaning up invalid plugins from config: {', '.join(to_remove)}"
-        )
+        log.debug("Cleaning up invalid plugins from config: %s", ", ".join(to_remove))
         for name in to_remove:
             del config["plugins"][name]
 
-        # Write back changes
+        # Write back changes (only reached when something was removed)
         config_path = Path.home() / ".config" / "clockwork-orange.yml"
         try:
-            # Create a simplified args object for write_config_file equivalent
-            # But simpler here since we just dump the dict
-            with open(config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=True)
-            print(f"[DEBUG] Configuration cleaned and saved")
+            from config_migrations import save_config
+
+            save_config(config, config_path)
+            log.debug("Configuration cleaned and saved")
         except Exception as e:
             print(f"[ERROR] Failed to save cleaned configuration: {e}")
 
 
 def main():
+    _configure_logging()
+
     # Helper: specific check to default to GUI on double-click (Windows mostly)
     if len(sys.argv) == 1:
         sys.argv.append("--gui")
 
     # Set AppUserModelID on Windows for correct taskbar icon
     if sys.platform == "win32":
+        import ctypes
+
         myappid = "ushineko.clockworkorange.gui.1.0"  # arbitrary string
         try:
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
@@ -837,11 +1208,12 @@ def main():
 
     parser = _create_argument_parser()
     args = parser.parse_args()
+    _check_plugin_choice(parser, args)
 
     # Only print debug messages if not running a plugin (to keep JSON output clean)
     if not hasattr(args, "run_plugin") or not args.run_plugin:
-        print(f"[DEBUG] Startup initiated at {start_time}")
-        print(f"[DEBUG] Arguments parsed in {time.time() - start_time:.4f}s")
+        log.debug("Startup initiated at %s", start_time)
+        log.debug("Arguments parsed in %.4fs", time.time() - start_time)
 
     # Handle Plugin Execution (App-as-Interpreter)
     if args.run_plugin:
@@ -864,7 +1236,7 @@ def main():
             # Final result is printed to original stdout
             sys.stdout = sys.stderr
             try:
-                pm = PluginManager()
+                pm = _get_plugin_manager()
                 # Access private method directly to avoid capture overhead of other methods
                 instance = pm._get_plugin_instance(plugin_name)
                 result = instance.run(config)
@@ -897,25 +1269,13 @@ def main():
         # Test 2: Critical Imports
         modules = ["ctypes", "sqlite3", "ssl", "PIL", "requests", "yaml", "watchdog"]
         for mod in modules:
-            try:
-                __import__(mod)
-                print(f"[OK] Import {mod}")
-                results[mod] = True
-            except ImportError as e:
-                print(f"[FAIL] Import {mod}: {e}")
-                results[mod] = False
+            results[mod] = _self_test_import(mod)
 
         # Test 2a: Platform-specific imports
         if sys.platform == "darwin":
             macos_modules = ["AppKit", "Foundation", "objc"]
             for mod in macos_modules:
-                try:
-                    __import__(mod)
-                    print(f"[OK] Import {mod}")
-                    results[mod] = True
-                except ImportError as e:
-                    print(f"[FAIL] Import {mod}: {e}")
-                    results[mod] = False
+                results[mod] = _self_test_import(mod)
 
         # Test 2b: Verify watchdog loaded from bundle (when frozen)
         if is_frozen:
@@ -928,7 +1288,7 @@ def main():
                 watchdog_platform_module = 'watchdog.observers.inotify'
             watchdog_modules = [
                 'watchdog', 'watchdog.events', 'watchdog.observers',
-                watchdog_platform_module
+                'watchdog.observers.polling', watchdog_platform_module
             ]
             bundle_ok = True
             for wmod in watchdog_modules:
@@ -950,10 +1310,8 @@ def main():
 
         # Test 3: SSL/Network
         try:
-            import requests
-
             print("Testing Network/SSL...")
-            requests.get("https://www.google.com", timeout=5)
+            _self_test_tls_handshake("www.google.com")
             print("[OK] Network/SSL Request")
             results["network"] = True
         except Exception as e:
@@ -962,7 +1320,7 @@ def main():
 
         # Test 4: Plugins
         try:
-            pm = PluginManager()
+            pm = _get_plugin_manager()
             plugins = pm.get_available_plugins()
             print(f"Plugins Found: {plugins}")
             if not plugins:
@@ -981,13 +1339,20 @@ def main():
         sys.stdout.flush()
         sys.stderr.flush()
         # Use os._exit to avoid any atexit handlers or cleanup that might change exit code
-        import os
         os._exit(exit_code)
 
+    # Read-only diagnostic: needs neither the config file nor the plugins.
+    # Its report is printed unconditionally, so skipping the config's
+    # `debug` setting here doesn't hide any of it
+    if args.debug_lockscreen:
+        debug_lockscreen_config()
+        return
+
     # Load configuration file and merge with command line arguments
     config = load_config_file()
+    _apply_debug_setting(config)
 
-    # Auto-clean configuration
+    # Auto-clean configuration (only discovers plugins if the config has any)
     clean_config(config)
 
     args = merge_config_with_args(config, args)
@@ -995,60 +1360,55 @@ def main():
     # Handle GUI option early
     _handle_gui_mode(args)
 
-    # Check for implicit multi-plugin mode capability
-    has_enabled_plugins = False
-    if config.get("plugins"):
-        for p_cfg in config["plugins"].values():
-            if p_cfg.get("enabled"):
-                has_enabled_plugins = True
-                break
-
-    # Validate arguments
-    _validate_args(parser, args, has_enabled_plugins)
-
-    # Handle debug option
-    if args.debug_lockscreen:
-        debug_lockscreen_config()
-        return
+    # Validate arguments (enabled plugins allow implicit multi-plugin mode)
+    _validate_args(parser, args, has_enabled_plugins(config))
 
     # Handle write-config option
     if args.write_config:
         success = write_config_file(args)
         if success:
-            print("[DEBUG] Configuration file written successfully")
+            log.debug("Configuration file written successfully")
             sys.exit(0)
         else:
             print("[ERROR] Failed to write configuration file")
             sys.exit(1)
 
-    plugin_manager = PluginManager()
+    plugin_manager = _get_plugin_manager()
 
     # Resolve plugin if specified
     if args.plugin:
         _handle_specific_plugin_execution(args, config, plugin_manager)
 
+    # Resolve the directory once so every cycle, whichever helper it goes
+    # through, hits the same entry in the mtime-keyed scan cache (_DIR_CACHE)
+    # instead of rescanning under a different spelling of the path.
+    if args.directory:
+        args.directory = args.directory.resolve()
+
+    # Cycling modes run until interrupted; stop them cleanly on Ctrl+C or
+    # SIGTERM. One-shot runs keep the default behaviour. Dynamic plugin
+    # cycling (no explicit source) also reloads its config on SIGHUP.
+    if args.wait is not None:
+        _install_signal_handlers(
+            reload_on_hup=not (
+                args.url or args.file or args.directory or args.plugin
+            )
+        )
+
     target_desc = _get_target_description(args)
-    print(f"[DEBUG] Starting {target_desc} set process")
+    log.debug("Starting %s set process", target_desc)
 
     success = _perform_wallpaper_operation(args, config, plugin_manager)
 
     if success:
-        print(f"[DEBUG] {target_desc.capitalize()} set successfully")
-        print("[DEBUG] Process completed")
+        log.debug("%s set successfully", target_desc.capitalize())
+        log.debug("Process completed")
     else:
         print(f"[ERROR] Failed to set {target_desc}")
         sys.exit(1)
 
 
-def _create_argument_parser():
-    """Create and return the argument parser."""
-    plugin_manager = PluginManager()
-    available_plugins = plugin_manager.get_available_plugins()
-
-    parser = argparse.ArgumentParser(
-        description="Set wallpaper or lock screen from URL, local file, or random image from directory (Linux KDE Plasma 6, Windows 10/11, macOS)",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Supported platforms: Linux (KDE Plasma 6), Windows 10/11, macOS 13+.
 Linux requires qdbus6 and kwriteconfig6 commands (KDE Plasma 6).
 
@@ -1081,7 +1441,86 @@ Configuration File:
   
   # Start graphical user interface:
   %(prog)s --gui
-        """,
+        """
+
+
+def _self_test_import(mod: str) -> bool:
+    """Check that a module is bundled and actually imports.
+
+    find_spec() answers "is it bundled" without running any module code, so a
+    missing module fails fast. Found modules are still imported: a frozen
+    build can ship a package whose native extension fails to load, which only
+    a real import reveals.
+    """
+    import importlib.util
+
+    try:
+        if importlib.util.find_spec(mod) is None:
+            print(f"[FAIL] Import {mod}: module not found")
+            return False
+        __import__(mod)
+    except Exception as e:
+        print(f"[FAIL] Import {mod}: {e}")
+        return False
+    print(f"[OK] Import {mod}")
+    return True
+
+
+def _self_test_tls_handshake(host: str, port: int = 443, timeout: float = 5):
+    """Open a TLS connection to host and close it again; raises on failure.
+
+    The handshake verifies against certifi's CA bundle, as requests does, so
+    a frozen build with a missing or broken bundle still fails. No HTTP
+    request is sent and no body is downloaded.
+    """
+    import socket
+    import ssl
+
+    import certifi
+
+    context = ssl.create_default_context(cafile=certifi.where())
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host):
+            pass
+
+
+def _create_argument_parser(argv=None):
+    """Create and return the argument parser.
+
+    Plugin discovery is only needed to list the plugins in --help; --plugin
+    itself is checked after parsing by _check_plugin_choice(), so flags like
+    --gui, --self-test and --debug-lockscreen never scan the plugins directory
+    just to build the parser.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "-h" in argv or "--help" in argv:
+        plugin_manager = _get_plugin_manager()
+        return _build_argument_parser(tuple(plugin_manager.get_available_plugins()))
+    return _build_argument_parser()
+
+
+def _check_plugin_choice(parser, args):
+    """Reject an unknown --plugin name, as argparse choices= would."""
+    if not args.plugin:
+        return
+    available = _get_plugin_manager().get_available_plugins()
+    if args.plugin not in available:
+        parser.error(
+            f"argument --plugin: invalid choice: '{args.plugin}' "
+            f"(choose from {', '.join(available)})"
+        )
+
+
+@lru_cache(maxsize=2)
+def _build_argument_parser(available_plugins: tuple = ()):
+    """Build the argument parser once per set of plugins listed in --help."""
+    plugin_help = "Use a specific plugin source"
+    if available_plugins:
+        plugin_help += f'. Available: {", ".join(available_plugins)}'
+    parser = argparse.ArgumentParser(
+        description="Set wallpaper or lock screen from URL, local file, or random image from directory (Linux KDE Plasma 6, Windows 10/11, macOS)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Target selection
@@ -1109,11 +1548,7 @@ Configuration File:
         type=Path,
         help="Set random wallpaper from directory (Legacy)",
     )
-    group.add_argument(
-        "--plugin",
-        choices=available_plugins,
-        help=f'Use a specific plugin source. Available: {", ".join(available_plugins)}',
-    )
+    group.add_argument("--plugin", help=plugin_help)
 
     parser.add_argument(
         "--plugin-config",
@@ -1206,13 +1641,14 @@ def _validate_args(parser, args, has_enabled_plugins):
 
 def _handle_specific_plugin_execution(args, config, plugin_manager):
     """Handle execution of a specifically requested plugin via CLI."""
-    print(f"[DEBUG] Plugin mode: {args.plugin}")
+    log.debug("Plugin mode: %s", args.plugin)
     # Determine config for plugin
     plugin_config = {}
 
     # Check for config in file first
-    if config.get("plugins", {}).get(args.plugin):
-        plugin_config = config["plugins"][args.plugin]
+    file_config = (config.get("plugins") or {}).get(args.plugin)
+    if file_config:
+        plugin_config = dict(file_config)
 
     # CLI config overrides file config
     if args.plugin_config:
@@ -1224,18 +1660,24 @@ def _handle_specific_plugin_execution(args, config, plugin_manager):
             sys.exit(1)
 
     # Execute plugin
-    print(f"[DEBUG] Executing plugin {args.plugin} with config: {plugin_config}")
+    log.debug("Executing plugin %s with config: %s", args.plugin, plugin_config)
     result = plugin_manager.execute_plugin(args.plugin, plugin_config)
 
     if result.get("status") == "success":
         ret_path = Path(result["path"])
-        print(f"[DEBUG] Plugin returned path: {ret_path}")
+        log.debug("Plugin returned path: %s", ret_path)
 
-        if ret_path.is_dir():
-            print(f"[DEBUG] Plugin resolved to directory")
+        # One stat() answers both the directory and the file question
+        try:
+            mode = ret_path.stat().st_mode
+        except OSError:
+            mode = 0
+
+        if stat.S_ISDIR(mode):
+            log.debug("Plugin resolved to directory")
             args.directory = ret_path
-        elif ret_path.is_file():
-            print(f"[DEBUG] Plugin resolved to file")
+        elif stat.S_ISREG(mode):
+            log.debug("Plugin resolved to file")
             args.file = ret_path
         else:
             print(f"[ERROR] Plugin returned invalid path: {ret_path}")
@@ -1266,11 +1708,11 @@ def _handle_dual_mode(args, config, plugin_manager):
         print(f"[ERROR] Use --desktop --lockscreen -d /path/to/directory instead")
         sys.exit(1)
     elif args.directory:
-        print(f"[DEBUG] Dual wallpaper directory mode: {args.directory}")
+        log.debug("Dual wallpaper directory mode: %s", args.directory)
         if args.wait is not None:
             # Continuous cycling mode for dual wallpapers
-            print(
-                f"[DEBUG] Dual wallpaper continuous mode with {args.wait} second intervals"
+            log.debug(
+                "Dual wallpaper continuous mode with %s second intervals", args.wait
             )
             cycle_dual_wallpapers_from_directory(args.directory, args.wait)
             return True  # If we reach here, cycling completed successfully
@@ -1297,14 +1739,12 @@ def _handle_dual_mode(args, config, plugin_manager):
 def _handle_lockscreen_mode(args, config, plugin_manager):
     """Handle lock screen wallpaper operations."""
     if args.file:
-        print(f"[DEBUG] Lock screen file mode: {args.file}")
+        log.debug("Lock screen file mode: %s", args.file)
         return set_lockscreen_wallpaper(args.file)
     elif args.directory:
-        print(f"[DEBUG] Lock screen directory mode: {args.directory}")
+        log.debug("Lock screen directory mode: %s", args.directory)
         if args.wait is not None:
-            print(
-                f"[DEBUG] Lock screen continuous mode with {args.wait} second intervals"
-            )
+            log.debug("Lock screen continuous mode with %s second intervals", args.wait)
             cycle_lockscreen_wallpapers_from_directory(args.directory, args.wait)
             return True
         else:
@@ -1332,15 +1772,15 @@ def _handle_lockscreen_mode(args, config, plugin_manager):
 def _handle_desktop_mode(args, config, plugin_manager):
     """Handle desktop wallpaper operations."""
     if args.url:
-        print(f"[DEBUG] Desktop URL mode: {args.url}")
+        log.debug("Desktop URL mode: %s", args.url)
         return download_and_set_wallpaper(args.url)
     elif args.file:
-        print(f"[DEBUG] Desktop file mode: {args.file}")
+        log.debug("Desktop file mode: %s", args.file)
         return set_local_wallpaper(args.file)
     elif args.directory:
-        print(f"[DEBUG] Desktop directory mode: {args.directory}")
+        log.debug("Desktop directory mode: %s", args.directory)
         if args.wait is not None:
-            print(f"[DEBUG] Desktop continuous mode with {args.wait} second intervals")
+            log.debug("Desktop continuous mode with %s second intervals", args.wait)
             cycle_wallpapers_from_directory(args.directory, args.wait)
             return True
         else:
@@ -1369,15 +1809,15 @@ def _handle_desktop_mode(args, config, plugin_manager):
 def _handle_default_mode(args, config, plugin_manager):
     """Handle default wallpaper operations (no explicit target)."""
     if args.url:
-        print(f"[DEBUG] URL mode: {args.url}")
+        log.debug("URL mode: %s", args.url)
         return download_and_set_wallpaper(args.url)
     elif args.file:
-        print(f"[DEBUG] File mode: {args.file}")
+        log.debug("File mode: %s", args.file)
         return set_local_wallpaper(args.file)
     elif args.directory:
-        print(f"[DEBUG] Directory mode: {args.directory}")
+        log.debug("Directory mode: %s", args.directory)
         if args.wait is not None:
-            print(f"[DEBUG] Continuous mode with {args.wait} second intervals")
+            log.debug("Continuous mode with %s second intervals", args.wait)
             cycle_wallpapers_from_directory(args.directory, args.wait)
             return True
         else:
@@ -1386,9 +1826,7 @@ def _handle_default_mode(args, config, plugin_manager):
         # Check for enabled plugins (Dynamic Multi-Plugin Mode)
         initial_sources = collect_plugin_sources(config, plugin_manager)
         if initial_sources:
-            print(
-                f"[DEBUG] Multi-plugin mode active with {len(initial_sources)} sources"
-            )
+            log.debug("Multi-plugin mode active with %s sources", len(initial_sources))
             if args.wait:
                 cycle_dynamic_plugins(plugin_manager, args.wait)
                 return True
@@ -1402,135 +1840,114 @@ def _handle_default_mode(args, config, plugin_manager):
             sys.exit(1)
 
 
+# Mode handlers keyed on (desktop, lockscreen). Each handler owns the
+# url/file/directory/dynamic decision for its target.
+_MODE_HANDLERS = {
+    (True, True): _handle_dual_mode,
+    (False, True): _handle_lockscreen_mode,
+    (True, False): _handle_desktop_mode,
+    (False, False): _handle_default_mode,
+}
+
+
 def _perform_wallpaper_operation(args, config, plugin_manager):
     """Dispatch wallpaper operation based on mode."""
-    if args.desktop and args.lockscreen:
-        return _handle_dual_mode(args, config, plugin_manager)
-    elif args.lockscreen:
-        return _handle_lockscreen_mode(args, config, plugin_manager)
-    elif args.desktop:
-        return _handle_desktop_mode(args, config, plugin_manager)
-    else:
-        return _handle_default_mode(args, config, plugin_manager)
+    handler = _MODE_HANDLERS[(bool(args.desktop), bool(args.lockscreen))]
+    return handler(args, config, plugin_manager)
+
+
+def _load_gui():
+    """Import the GUI entry point on demand. Returns None if PyQt6 is missing."""
+    try:
+        from gui.main_window import main as gui_main
+    except ImportError as e:
+        print(f"GUI Import Error: {e}")
+        return None
+    return gui_main
 
 
 def _handle_gui_mode(args):
     """Start GUI if requested."""
     if args.gui:
-        if not GUI_AVAILABLE:
+        gui_main = _load_gui()
+        if gui_main is None:
             print("[ERROR] GUI not available. Please install PyQt6: pip install PyQt6")
             input("Press Enter to exit...")
             sys.exit(1)
-        print(f"[DEBUG] Starting GUI... SysArgv: {sys.argv}")
+        log.debug("Starting GUI... SysArgv: %s", sys.argv)
         try:
             sys.exit(gui_main())
         except Exception as e:
             print(f"[FATAL] GUI Crashed: {e}")
-            import traceback
-
             traceback.print_exc()
             input("Press Enter to exit...")
             sys.exit(1)
 
 
+# Stale kscreenlockerrc keys removed after setting the lock screen wallpaper:
+# the lowercase "image" key and the old Greeter wallpaper entry, plus
+# lowercase [Daemon] duplicates (lockonresume vs LockOnResume, etc) that
+# cause python configparser to fail and might confuse KDE.
+_REDUNDANT_LOCKSCREEN_KEYS = (
+    (platform_utils.KSCREENLOCKER_IMAGE_GROUP, "image"),
+    ("Greeter", "wallpaper"),
+    ("Daemon", "lockonresume"),
+    ("Daemon", "timeout"),
+    ("Daemon", "autolock"),
+)
+
+
 def _clean_lockscreen_config():
     """Clean up redundant entries in kscreenlockerrc."""
     try:
-        print(f"[DEBUG] Cleaning up redundant configuration entries...")
-        subprocess.run(
-            [
-                "kwriteconfig6",
-                "--file",
-                "kscreenlockerrc",
-                "--group",
-                "Greeter",
-                "--group",
-                "Wallpaper",
-                "--group",
-                "org.kde.image",
-                "--group",
-                "General",
-                "--key",
-                "image",  # Remove lowercase image key
-                "--delete",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        # Also remove the main Greeter wallpaper entry
-        subprocess.run(
-            [
-                "kwriteconfig6",
-                "--file",
-                "kscreenlockerrc",
-                "--group",
-                "Greeter",
-                "--key",
-                "wallpaper",
-                "--delete",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        # Cleanup [Daemon] section duplicates (lockonresume vs LockOnResume, etc)
-        # These cause python configparser to fail and might confuse KDE
-        for key in ["lockonresume", "timeout", "autolock"]:
-            subprocess.run(
-                [
-                    "kwriteconfig6",
-                    "--file",
-                    "kscreenlockerrc",
-                    "--group",
-                    "Daemon",
-                    "--key",
-                    key,
-                    "--delete",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+        log.debug("Cleaning up redundant configuration entries...")
+        # One in-process edit; kwriteconfig6 per key only as a fallback
+        if not platform_utils.delete_kscreenlocker_keys(_REDUNDANT_LOCKSCREEN_KEYS):
+            for group, key in _REDUNDANT_LOCKSCREEN_KEYS:
+                group_args = []
+                for name in group.split("]["):
+                    group_args += ["--group", name]
+                subprocess.run(
+                    ["kwriteconfig6", "--file", "kscreenlockerrc"]
+                    + group_args
+                    + ["--key", key, "--delete"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
 
-        print(f"[DEBUG] Redundant entries cleaned up")
+        log.debug("Redundant entries cleaned up")
     except Exception as e:
         print(f"[WARNING] Could not clean up redundant entries: {e}")
 
 
 def _reload_screensaver_config():
     """Reload the screen saver configuration via DBus."""
-    print(f"[DEBUG] Attempting to reload screen saver configuration...")
+    log.debug("Attempting to reload screen saver configuration...")
 
     # Try multiple services and methods to ensure reliability
     services = ["org.freedesktop.ScreenSaver", "org.kde.screensaver"]
     methods = ["configure", "org.kde.screensaver.configure"]
 
-    success = False
+    # Any one successful call is enough; stop at the first one
+    attempts = [(service, method) for service in services for method in methods]
+    for service, method in attempts:
+        try:
+            cmd = ["qdbus6", service, "/ScreenSaver", method]
+            result = subprocess.run(cmd, check=False, capture_output=True, text=True)
+            if result.returncode == 0:
+                log.debug("Successfully called %s on %s", method, service)
+                log.debug("Screen saver configuration reload signal sent")
+                return
+        except FileNotFoundError as e:
+            # No qdbus6 at all; the remaining attempts would fail the same way
+            print(f"[WARNING] Error calling {method} on {service}: {e}")
+            break
+        except Exception as e:
+            print(f"[WARNING] Error calling {method} on {service}: {e}")
 
-    for service in services:
-        for method in methods:
-            try:
-                cmd = ["qdbus6", service, "/ScreenSaver", method]
-                # print(f"[DEBUG] Calling: {' '.join(cmd)}")
-                result = subprocess.run(
-                    cmd, check=False, capture_output=True, text=True
-                )
-                if result.returncode == 0:
-                    print(f"[DEBUG] Successfully called {method} on {service}")
-                    success = True
-                # else:
-                #    print(f"[DEBUG] Failed call {method} on {service}: {result.stderr.strip()}")
-            except Exception as e:
-                print(f"[WARNING] Error calling {method} on {service}: {e}")
-
-    if not success:
-        print(f"[WARNING] All attempts to reload screen saver configuration failed")
-        print(f"[DEBUG] You may need to log out and back in for changes to take effect")
-    else:
-        print(f"[DEBUG] Screen saver configuration reload signal sent")
+    print(f"[WARNING] All attempts to reload screen saver configuration failed")
+    log.debug("You may need to log out and back in for changes to take effect")
 
 
 def _execute_dynamic_cycle(plugin_manager, desktop, lockscreen):
@@ -1538,6 +1955,7 @@ def _execute_dynamic_cycle(plugin_manager, desktop, lockscreen):
     try:
         # 1. Reload Config
         config = load_config_file()
+        _apply_debug_setting(config)
 
         # 2. Collect Sources
         sources = collect_plugin_sources(config, plugin_manager)
@@ -1554,64 +1972,93 @@ def _execute_dynamic_cycle(plugin_manager, desktop, lockscreen):
                 success = set_random_wallpaper_from_sources(sources)
 
             if success:
-                print(f"[DEBUG] Wallpaper set successfully")
+                log.debug("Wallpaper set successfully")
             else:
                 print(f"[ERROR] Failed to set wallpaper")
         else:
-            print(f"[DEBUG] No plugins enabled or sources found.")
+            log.debug("No plugins enabled or sources found.")
 
         # Return latest config for wait interval
         return config
 
     except Exception as e:
         print(f"[ERROR] Error in cycle: {e}")
-        import traceback
-
         traceback.print_exc()
         return {}
 
 
-class ConfigWatcher(FileSystemEventHandler):
-    """Watch for configuration file changes."""
+class ConfigWatcher:
+    """Watch for configuration file changes.
+
+    A watchdog event handler. Rather than subclassing FileSystemEventHandler
+    it provides dispatch() itself, which is all the observer calls, so
+    watchdog is only imported once dynamic cycling starts.
+    """
 
     def __init__(self, config_path, change_event):
         self.config_path = Path(config_path).resolve()
+        # File names an event for the config can carry: the configured one and,
+        # if it is a symlink, its target's.
+        self.config_names = frozenset({Path(config_path).name, self.config_path.name})
+        # Spellings that are the config without asking the filesystem. The
+        # observer watches the configured directory, so a write to the config
+        # almost always arrives as exactly one of these.
+        self.config_path_strs = frozenset({str(config_path), str(self.config_path)})
         self.change_event = change_event
 
+    def _is_config(self, path) -> bool:
+        # The usual case, a write to the config itself, is one set lookup
+        if path in self.config_path_strs:
+            return True
+        # ~/.config is shared with every other application; compare the bare
+        # name first so unrelated events don't pay for resolve().
+        if os.path.basename(path) not in self.config_names:
+            return False
+        return Path(path).resolve() == self.config_path
+
     def _process_event(self, event):
-        # We try to match by path.
-        # Note: event.src_path is absolute if we watch a dir with observer,
-        # but safely check resolve.
+        # A single save is often several events (backup, write, rename). While
+        # a change is already pending there is nothing to add: the wait loop
+        # debounces the burst (_drain_config_change_burst) and clears the event.
+        if self.change_event.is_set():
+            return
         try:
-            event_path = Path(event.src_path).resolve()
-
             # Check for direct match
-            if event_path == self.config_path:
-                print(
-                    f"[DEBUG] Config change detected (Event: {event.event_type}), triggering update..."
+            if self._is_config(event.src_path):
+                log.debug(
+                    "Config change detected (Event: %s), triggering update...",
+                    event.event_type,
                 )
                 self.change_event.set()
                 return
 
             # Handle atomic moves (moved_to)
             if event.event_type == "moved":
-                dest_path = Path(event.dest_path).resolve()
-                if dest_path == self.config_path:
-                    print(
-                        f"[DEBUG] Config move detected (Event: {event.event_type}), triggering update..."
+                if self._is_config(event.dest_path):
+                    log.debug(
+                        "Config move detected (Event: %s), triggering update...",
+                        event.event_type,
                     )
                     self.change_event.set()
         except Exception as e:
-            print(f"[DEBUG] Error processing event: {e}")
+            log.debug("Error processing event: %s", e)
+
+    @staticmethod
+    def event_filter():
+        """Event classes worth delivering, for observer.schedule().
 
-    def on_modified(self, event):
-        self._process_event(event)
+        ~/.config sees constant open/close traffic from other applications.
+        With a filter the emitter drops everything else before it reaches
+        dispatch(); the inotify emitter doesn't even ask the kernel for it.
+        """
+        from watchdog.events import (FileCreatedEvent, FileModifiedEvent,
+                                     FileMovedEvent)
 
-    def on_created(self, event):
-        self._process_event(event)
+        return [FileModifiedEvent, FileCreatedEvent, FileMovedEvent]
 
-    def on_moved(self, event):
-        self._process_event(event)
+    def dispatch(self, event):
+        if event.event_type in ("modified", "created", "moved"):
+            self._process_event(event)
 
 
 def _drain_config_change_burst(
@@ -1626,7 +2073,7 @@ def _drain_config_change_burst(
     Returns promptly if shutdown is requested.
     """
     if is_shutdown is None:
-        is_shutdown = lambda: shutdown_requested
+        is_shutdown = shutdown_event.is_set
 
     change_event.clear()
     while not is_shutdown():
@@ -1647,39 +2094,27 @@ def _wait_for_next_cycle(config, default_wait, change_event=None):
             sleep_duration = int(config["default_wait"])
         except (ValueError, TypeError):
             pass
+        # A negative interval would make every wait below return at once and
+        # spin through cycles back to back
+        if sleep_duration <= 0:
+            print(f"[WARN] Ignoring non-positive default_wait: {config['default_wait']}")
+            sleep_duration = default_wait
 
-    # If we have a change event, wait on it
     if change_event:
-        # We still loop to check shutdown_requested, but use event.wait with timeout
-        # However, event.wait returns true if event set, false if timeout.
-        # If event set, we debounce the burst then return to trigger one cycle.
-
-        start_time = time.time()
-        while time.time() - start_time < sleep_duration:
-            if shutdown_requested:
-                break
-
-            # Wait for 1 second or until event is set
-            # We chunk it to 1s to check shutdown_requested efficiently
-            # OR we could just wait(remaining) if shutdown_requested was handled via another signal event,
-            # but shutdown_requested is a simple bool flag here.
-
-            # Better: wait for the event with a 1s timeout
-            if change_event.wait(timeout=1.0):
-                # Coalesce any rapid follow-up writes (common at login) into a
-                # single trigger before cycling.
-                _drain_config_change_burst(change_event)
-                if shutdown_requested:
-                    return
-                print(f"[DEBUG] Config change detected, interrupting wait cycle")
-                return  # Exit wait immediately
-
+        # One blocking wait for the whole interval. The signal handler sets the
+        # change event as well, so shutdown wakes this wait immediately.
+        if change_event.wait(timeout=sleep_duration):
+            if shutdown_event.is_set():
+                return
+            # Coalesce any rapid follow-up writes (common at login) into a
+            # single trigger before cycling.
+            _drain_config_change_burst(change_event)
+            _invalidate_config_cache()
+            if not shutdown_event.is_set():
+                log.debug("Config change detected, interrupting wait cycle")
     else:
-        # Legacy fallback
-        for _ in range(sleep_duration):
-            if shutdown_requested:
-                break
-            time.sleep(1)
+        # No config watcher: sleep the whole interval, waking on shutdown
+        shutdown_event.wait(timeout=sleep_duration)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,24 @@ One-time config migrations applied on every config load.
 Each migration is idempotent: running a second time after the change has landed
 is a no-op. Migrations mutate the passed-in dict and return True if anything
 changed, so callers know whether to re-persist the file.
+
+Also home to save_config(), the config writer shared by the CLI and the GUI.
 """
 
 from pathlib import Path
 
 import yaml
 
+from platform_utils import replace_file_atomically
+
+# libyaml-backed loader/dumper when PyYAML was built with it (much faster),
+# otherwise the pure-Python equivalents.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 OLD_GOOGLE_IMAGES_DEFAULT_DIR = str(
     Path.home() / "Pictures" / "Wallpapers" / "GoogleImages"
 )
@@ -63,12 +75,11 @@ def load_and_migrate(config_path: Path) -> dict:
     import sys
 
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=SafeLoader) or {}
 
     if apply_migrations(config):
         try:
-            with open(config_path, "w") as f:
-                yaml.safe_dump(config, f, sort_keys=True)
+            save_config(config, config_path)
             print(
                 f"[config-migration] Persisted migrated config to {config_path}",
                 file=sys.stderr,
@@ -81,3 +92,28 @@ def load_and_migrate(config_path: Path) -> dict:
             )
 
     return config
+
+
+def save_config(config: dict, config_path: Path) -> bool:
+    """Write config as YAML, atomically replacing config_path.
+
+    The write goes through platform_utils.replace_file_atomically, so a crash
+    mid-write never leaves a truncated config behind and a symlinked config
+    keeps its link. A file that already holds the same YAML is left alone:
+    rewriting it would only wake the config watcher of a running service.
+
+    Returns True if the file was written, False if it was unchanged. Raises
+    on failure.
+    """
+    config_path = Path(config_path)
+    text = yaml.dump(
+        config, Dumper=SafeDumper, default_flow_style=False, sort_keys=True
+    )
+    try:
+        if config_path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    replace_file_atomically(config_path, text)
+    return True
@@ -5,16 +5,19 @@ Create a logo for Clockwork Orange - resizing from source image
 
 import os
 import sys
+from functools import lru_cache
 
+from PIL import Image, ImageMath
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QImage, QPixmap
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QApplication
 
 SOURCE_IMAGE = "img/clockwork_orange_icon.png"
 
 
-def create_clockwork_orange_logo(size=256):
-    """Load and resize source image"""
+@lru_cache(maxsize=1)
+def load_source_image():
+    """Decode the source image once; every logo size is scaled from it"""
     if not os.path.exists(SOURCE_IMAGE):
         print(f"Error: Source image not found: {SOURCE_IMAGE}")
         sys.exit(1)
@@ -23,56 +26,93 @@ def create_clockwork_orange_logo(size=256):
     if image.isNull():
         print(f"Error: Failed to load image: {SOURCE_IMAGE}")
         sys.exit(1)
+    return image
+
+
+@lru_cache(maxsize=1)
+def load_keyed_source_image():
+    """Source image with its background removed, at the source's own resolution.
+
+    Keying once here, on the real pixel grid, means every size is a single
+    resample of the keyed image: no per-size keying pass, and small icons
+    aren't downscaled from an upscaled intermediate.
+
+    The result is stored premultiplied, the format Qt's smooth scaler works
+    in, so no size needs a conversion before its resample.
+    """
+    # We assume the top-left pixel represents the background color
+    return remove_background(load_source_image()).convertToFormat(
+        QImage.Format.Format_ARGB32_Premultiplied
+    )
+
 
-    # Scale image to requested size with high quality
-    scaled_image = image.scaled(
+def scale_logo_image(size):
+    """Resize the background-free source image to a QImage"""
+    # QImage.scaled() returns a copy, so the cached image is never modified
+    return load_keyed_source_image().scaled(
         size,
         size,
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation,
     )
 
-    # Attempt to remove background
-    # We assume the top-left pixel represents the background color
-    if not scaled_image.isNull():
-        # Convert to ARGB32 to ensure we have an alpha channel
-        scaled_image = scaled_image.convertToFormat(QImage.Format.Format_ARGB32)
-
-        # Get background color from pixel (0,0)
-        bg_color = scaled_image.pixelColor(0, 0)
-        bg_r, bg_g, bg_b = bg_color.red(), bg_color.green(), bg_color.blue()
 
-        width = scaled_image.width()
-        height = scaled_image.height()
-
-        # Use color distance for better edge handling
-        # threshold: colors closer than this are fully transparent
-        # fuzziness: colors between threshold and this get semi-transparent (fade out halo)
-        threshold = 30.0
-        fuzziness = 70.0
+def create_clockwork_orange_logo(size=256):
+    """Resize the background-free source image"""
+    return QPixmap.fromImage(scale_logo_image(size))
 
-        import math
 
-        for y in range(height):
-            for x in range(width):
-                pixel_color = scaled_image.pixelColor(x, y)
-                r, g, b = pixel_color.red(), pixel_color.green(), pixel_color.blue()
+def save_logo(size, filename):
+    """Write the logo at size to filename; returns the filename"""
+    if not scale_logo_image(size).save(filename):
+        print(f"Error: Failed to save {filename}")
+        sys.exit(1)
+    return filename
+
+
+def remove_background(image, threshold=30.0, fuzziness=70.0):
+    """Make pixels close to the top-left pixel's color transparent.
+
+    threshold: colors closer than this are fully transparent
+    fuzziness: colors between threshold and this get semi-transparent (fade out halo)
+
+    The per-pixel math runs in Pillow's ImageMath on whole channels rather
+    than a Python loop over QColor objects.
+    """
+    # RGBA8888 has the same byte order on every platform, so Pillow can read
+    # the pixel buffer as-is
+    image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    width, height = image.width(), image.height()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    pil_image = Image.frombuffer(
+        "RGBA", (width, height), bytes(bits), "raw", "RGBA", image.bytesPerLine(), 1
+    )
 
-                # Calculate Euclidean distance in RGB space
-                dist = math.sqrt((r - bg_r) ** 2 + (g - bg_g) ** 2 + (b - bg_b) ** 2)
+    r, g, b, a = pil_image.split()
+    bg_r, bg_g, bg_b = pil_image.getpixel((0, 0))[:3]
+    fade_scale = 255 / (fuzziness - threshold)
 
-                if dist < threshold:
-                    # Fully transparent
-                    scaled_image.setPixelColor(x, y, QColor(r, g, b, 0))
-                elif dist < fuzziness:
-                    # Semi-transparent (linear fade) to remove halo
-                    # Map [threshold, fuzziness] -> [0, 255]
-                    alpha = int(255 * (dist - threshold) / (fuzziness - threshold))
-                    scaled_image.setPixelColor(x, y, QColor(r, g, b, alpha))
+    def alpha_expr(args):
+        to_float = args["float"]
+        # Euclidean distance in RGB space
+        dist = (
+            (to_float(args["r"]) - bg_r) ** 2
+            + (to_float(args["g"]) - bg_g) ** 2
+            + (to_float(args["b"]) - bg_b) ** 2
+        ) ** 0.5
+        # Linear fade mapping [threshold, fuzziness] -> [0, 255]; clamped at 0
+        # below the threshold and capped by the existing alpha beyond it
+        fade = args["int"]((dist - threshold) * fade_scale)
+        return args["convert"](args["min"](args["max"](fade, 0), args["a"]), "L")
 
-        return QPixmap.fromImage(scaled_image)
+    alpha = ImageMath.lambda_eval(alpha_expr, r=r, g=g, b=b, a=a)
+    keyed = Image.merge("RGBA", (r, g, b, alpha))
 
-    return QPixmap.fromImage(scaled_image)
+    # copy() detaches the QImage from the Python bytes it was built on
+    return QImage(
+        keyed.tobytes(), width, height, width * 4, QImage.Format.Format_RGBA8888
+    ).copy()
 
 
 def main():
@@ -86,17 +126,18 @@ def main():
     # Create different sizes
     sizes = [16, 32, 48, 64, 128, 256, 512]
 
-    for size in sizes:
-        logo = create_clockwork_orange_logo(size)
-        filename = os.path.join(icons_dir, f"clockwork-orange-{size}x{size}.png")
-        logo.save(filename)
-        print(f"Created {filename}")
-
+    filenames = [
+        os.path.join(icons_dir, f"clockwork-orange-{size}x{size}.png")
+        for size in sizes
+    ]
     # Also create a default icon
-    logo = create_clockwork_orange_logo(128)
-    default_filename = os.path.join(icons_dir, "clockwork-orange.png")
-    logo.save(default_filename)
-    print(f"Created {default_filename}")
+    sizes.append(128)
+    filenames.append(os.path.join(icons_dir, "clockwork-orange.png"))
+
+    # The source is decoded and keyed once, on the first size; each size
+    # after that is a single resample and PNG encode
+    for size, filename in zip(sizes, filenames):
+        print(f"Created {save_logo(size, filename)}")
 
     print("Logo creation complete!")
 
@@ -5,7 +5,6 @@ Launches the application, navigates through tabs, captures screenshots,
 redacts sensitive text fields using introspection, and generates GUI.md.
 """
 import sys
-import time
 from pathlib import Path
 
 # Add project root to sys.path
@@ -13,27 +12,44 @@ PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from PIL import Image, ImageFilter
-from PyQt6.QtCore import QCoreApplication, QRect
-from PyQt6.QtWidgets import QApplication, QLineEdit, QPlainTextEdit, QTextEdit
+from PyQt6.QtCore import QEventLoop, QRect, QTimer
+from PyQt6.QtGui import QImage, QImageWriter, QPixmap
+from PyQt6.QtWidgets import (
+    QApplication,
+    QLineEdit,
+    QPlainTextEdit,
+    QTextEdit,
+    QTreeWidgetItemIterator,
+    QWidget,
+)
 
 # Mock configuration to avoid needing real config files
 from gui.main_window import ClockworkOrangeGUI
 from plugin_manager import PluginManager
 
 
+# Text input widgets that should be redacted
+SENSITIVE_WIDGET_TYPES = (QLineEdit, QTextEdit, QPlainTextEdit)
+
+
 def find_sensitive_widgets(window):
-    """Find all text input widgets that should be redacted."""
-    sensitive_widgets = []
-    # Find all QLineEdit, QTextEdit, QPlainTextEdit
-    for widget_type in [QLineEdit, QTextEdit, QPlainTextEdit]:
-        widgets = window.findChildren(widget_type)
-        for w in widgets:
-            # Skip if empty or read-only and small (likely labels or incidental)
-            # But Service Logs are ReadOnly, so we MUST include them.
-            # Maybe filter by visibility?
-            if w.isVisible():
-                sensitive_widgets.append(w)
-    return sensitive_widgets
+    """Find all visible text input widgets that should be redacted.
+
+    Only the page currently shown in the content stack is searched; widgets
+    on the other pages are hidden and would be filtered out anyway.
+    """
+    stack = getattr(window, "stack", None)
+    root = stack.currentWidget() if stack is not None else None
+    if root is None:
+        root = window
+
+    # One walk of the widget tree for every type, instead of one per type.
+    # Service Logs are read-only but still included.
+    return [
+        w
+        for w in root.findChildren(QWidget)
+        if isinstance(w, SENSITIVE_WIDGET_TYPES) and w.isVisible()
+    ]
 
 
 def get_widget_rect(window, widget):
@@ -65,37 +81,98 @@ def get_widget_rect(window, widget):
     return rect
 
 
-def apply_blur(pixmap_path, rects):
-    """Apply Gaussian blur to specific regions of the image using Pillow."""
-    try:
-        img = Image.open(pixmap_path)
-
-        # Create a mask or just process regions
-        for rect in rects:
-            # rect is (x, y, width, height)
-            # Ensure coordinates are within bounds
-            x1 = max(0, rect.x())
-            y1 = max(0, rect.y())
-            x2 = min(img.width, rect.x() + rect.width())
-            y2 = min(img.height, rect.y() + rect.height())
-
-            if x2 <= x1 or y2 <= y1:
-                continue
-
-            box = (x1, y1, x2, y2)
-
-            # Crop the region
-            region = img.crop(box)
-
-            # Apply heavy blur
-            blurred_region = region.filter(ImageFilter.GaussianBlur(radius=15))
-
-            # Paste back
-            img.paste(blurred_region, box)
-
-        img.save(pixmap_path)
-    except Exception as e:
-        print(f"Error applying blur: {e}")
+def _rect_area(rect):
+    return rect.width() * rect.height()
+
+
+def merge_rects(rects, margin=2):
+    """Combine overlapping or touching rects so no pixel is blurred twice.
+
+    Two rects within margin pixels of each other are replaced by their
+    bounding rect, but only when that box is no larger than the two areas
+    together, give or take the gap between them (nested widgets, stacked
+    fields), so merging never adds meaningful blur work.
+    """
+    merged = []
+    for rect in sorted(rects, key=lambda r: (r.y(), r.x())):
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            union = rect.united(other)
+            slack = margin * (union.width() + union.height())
+            if rect.adjusted(-margin, -margin, margin, margin).intersects(
+                other
+            ) and _rect_area(union) <= _rect_area(rect) + _rect_area(other) + slack:
+                # The grown rect may now reach ones already checked
+                rect = union
+                merged.pop(i)
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+# Regions are blurred at 1/BLUR_DOWNSCALE of their size and scaled back up
+BLUR_DOWNSCALE = 4
+
+
+def blur_regions(img, rects, radius=15):
+    """Apply Gaussian blur to specific regions of a Pillow image, in place.
+
+    Each region is blurred on its own: Pillow's blur costs time per pixel, so
+    one pass over the area spanning every rect is slower than several passes
+    over the rects themselves. The blur itself runs on a downscaled copy with
+    a proportionally smaller radius; redaction only has to destroy
+    readability, and the result looks the same.
+    """
+    for rect in rects:
+        # rect is (x, y, width, height)
+        # Ensure coordinates are within bounds
+        x1 = max(0, rect.x())
+        y1 = max(0, rect.y())
+        x2 = min(img.width, rect.x() + rect.width())
+        y2 = min(img.height, rect.y() + rect.height())
+
+        if x2 <= x1 or y2 <= y1:
+            continue
+
+        box = (x1, y1, x2, y2)
+        size = (x2 - x1, y2 - y1)
+
+        # Blur a shrunken copy of the region and paste it back at full size.
+        # reduce() box-averages straight out of the region, with no crop and
+        # no filter weights to compute
+        small = img.reduce(BLUR_DOWNSCALE, box=box)
+        small = small.filter(ImageFilter.GaussianBlur(radius=radius / BLUR_DOWNSCALE))
+        img.paste(small.resize(size, Image.Resampling.BILINEAR), box)
+    return img
+
+
+def pixmap_to_pil(pixmap):
+    """Copy a QPixmap's pixels into a Pillow image without encoding a file.
+
+    Opaque pixmaps, such as a grabbed window, come back as RGB: there is no
+    alpha channel to carry through the blur and the PNG encoder.
+    """
+    qimage = pixmap.toImage()
+    # RGBA8888 and RGB888 have the same byte order on every platform
+    if qimage.hasAlphaChannel():
+        mode, qformat = "RGBA", QImage.Format.Format_RGBA8888
+    else:
+        mode, qformat = "RGB", QImage.Format.Format_RGB888
+    qimage = qimage.convertToFormat(qformat)
+    bits = qimage.constBits()
+    bits.setsize(qimage.sizeInBytes())
+    return Image.frombuffer(
+        mode,
+        (qimage.width(), qimage.height()),
+        bytes(bits),
+        "raw",
+        mode,
+        qimage.bytesPerLine(),
+        1,
+    )
 
 
 # Mock configuration dict
@@ -140,6 +217,37 @@ class TestGUI(ClockworkOrangeGUI):
         self.plugin_manager = MockPluginManager()
 
 
+# How long to run the event loop before each capture, and once after the
+# window is first shown (milliseconds)
+CAPTURE_SETTLE_MS = 100
+STARTUP_SETTLE_MS = 500
+
+# zlib level for the PNGs: flat GUI screenshots barely shrink at higher
+# levels, which take noticeably longer to encode
+PNG_COMPRESS_LEVEL = 1
+# The same for Qt, whose PNG writer takes 0-100 and maps 11 to zlib level 1
+QT_PNG_COMPRESSION = 11
+
+
+def settle_event_loop(ms):
+    """Run the Qt event loop for ms milliseconds.
+
+    Unlike sleeping between processEvents() calls, timers and signals from
+    worker threads are delivered the moment they arrive.
+    """
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def save_pixmap(pixmap, file_path):
+    """Write a QPixmap to file_path as PNG using Qt's own encoder."""
+    writer = QImageWriter(str(file_path), b"png")
+    writer.setCompression(QT_PNG_COMPRESSION)
+    if not writer.write(pixmap.toImage()):
+        print(f"Error saving {file_path}: {writer.errorString()}")
+
+
 class ScreenshotGenerator:
     def __init__(self):
         self.app = QApplication(sys.argv)
@@ -148,6 +256,20 @@ class ScreenshotGenerator:
         self.window = TestGUI()
         self.window.resize(1100, 750)
         self.window.show()
+        # Let startup work (first paint, status threads) finish once up front
+        settle_event_loop(STARTUP_SETTLE_MS)
+
+        # The sidebar tree is built once, so index its items by label up front
+        self.tree_index = {}
+        iterator = QTreeWidgetItemIterator(self.window.tree)
+        while iterator.value():
+            item = iterator.value()
+            # Keep the first match, as a top-down search would find
+            self.tree_index.setdefault(item.text(0), item)
+            iterator += 1
+
+        # Reused for every capture; see grab_window()
+        self.capture_pixmap = None
 
         self.output_dir = PROJECT_ROOT / "docs" / "img"
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -157,14 +279,27 @@ class ScreenshotGenerator:
             "This document provides a tour of the user interface. Sensitive text areas in the screenshots have been automatically redacted.\n"
         )
 
+    def grab_window(self):
+        """Render the window into a pixmap that is reused between captures.
+
+        Same pixels as self.window.grab(), without allocating a new
+        window-sized buffer each time. Callers must copy or write the result
+        before the next capture.
+        """
+        dpr = self.window.devicePixelRatio()
+        size = self.window.size() * dpr
+        if self.capture_pixmap is None or self.capture_pixmap.size() != size:
+            self.capture_pixmap = QPixmap(size)
+            self.capture_pixmap.setDevicePixelRatio(dpr)
+        self.window.render(self.capture_pixmap)
+        return self.capture_pixmap
+
     def capture_screenshot(self, name, title, description):
         """Capture the current window state."""
         print(f"Capturing: {name}")
 
         # Allow GUI events to process and render
-        for _ in range(10):
-            QCoreApplication.processEvents()
-            time.sleep(0.05)
+        settle_event_loop(CAPTURE_SETTLE_MS)
 
         # 1. Identify sensitive areas
         sensitive_widgets = find_sensitive_widgets(self.window)
@@ -173,14 +308,23 @@ class ScreenshotGenerator:
             rect = get_widget_rect(self.window, w)
             if rect:
                 rects.append(rect)
+        rects = merge_rects(rects)
 
         # 2. Grab Window
-        pixmap = self.window.grab()
+        pixmap = self.grab_window()
         file_path = self.output_dir / f"{name}.png"
-        pixmap.save(str(file_path))
 
-        # 3. Apply Blur
-        apply_blur(file_path, rects)
+        # 3. Apply Blur in memory, so the PNG is only encoded once. With
+        # nothing to redact Qt writes the grab directly, skipping Pillow
+        if not rects:
+            save_pixmap(pixmap, file_path)
+        else:
+            try:
+                img = blur_regions(pixmap_to_pil(pixmap), rects)
+                img.save(file_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            except Exception as e:
+                print(f"Error applying blur: {e}")
+                save_pixmap(pixmap, file_path)
 
         # 4. Add to Markdown
         self.markdown_lines.append(f"## {title}\n")
@@ -189,22 +333,13 @@ class ScreenshotGenerator:
 
     def navigate_to(self, item_name):
         """Navigate the sidebar tree to the specified item."""
-        # Find item in tree
-        # The tree is user-friendly names?
-        # Let's search the tree
-        found = False
-        iterator = QTreeWidgetItemIterator(self.window.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.text(0) == item_name:
-                self.window.tree.setCurrentItem(item)
-                self.window.on_tree_item_clicked(item, 0)
-                found = True
-                break
-            iterator += 1
-
-        if not found:
+        item = self.tree_index.get(item_name)
+        if item is None:
             print(f"Warning: Could not navigate to '{item_name}'")
+            return
+
+        self.window.tree.setCurrentItem(item)
+        self.window.on_tree_item_clicked(item, 0)
 
     def run(self):
         # 1. Service Control
@@ -274,16 +409,12 @@ class ScreenshotGenerator:
 
         # Write Markdown
         md_path = PROJECT_ROOT / "GUI.md"
-        with open(md_path, "w") as f:
-            f.writelines(self.markdown_lines)
+        md_path.write_text("".join(self.markdown_lines), encoding="utf-8")
 
         print(f"Documentation generated at {md_path}")
         self.app.quit()
 
 
-# Helper for tree iteration since PyQt6 might handle iterators differently
-from PyQt6.QtWidgets import QTreeWidgetItemIterator
-
 if __name__ == "__main__":
     generator = ScreenshotGenerator()
     generator.run()
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import (QHBoxLayout, QLabel, QPushButton, QTextEdit,
+from PyQt6.QtWidgets import (QHBoxLayout, QLabel, QPlainTextEdit, QPushButton,
                              QVBoxLayout, QWidget)
 
 
@@ -52,13 +52,14 @@ class ActivityLogWidget(QWidget):
         header_layout.addWidget(clear_btn)
         layout.addLayout(header_layout)
 
-        # Log display
-        self.log_display = QTextEdit()
+        # Log display: plain text lays out per block, unlike QTextEdit's
+        # rich-text engine, so appends stay cheap under heavy logging
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
-        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
 
         # Native limiting prevents flashing from full rewrites
-        self.log_display.document().setMaximumBlockCount(self.MAX_LOG_LINES)
+        self.log_display.setMaximumBlockCount(self.MAX_LOG_LINES)
 
         # Use monospace font for logs
         font = QFont("Consolas", 9)
@@ -88,16 +89,17 @@ class ActivityLogWidget(QWidget):
 
     def refresh_logs(self):
         """Refresh the log display by appending new items from the queue."""
-        has_updates = False
+        messages = []
         while not self.log_queue.empty():
             try:
-                msg = self.log_queue.get_nowait()
-                self.log_display.append(msg)
-                has_updates = True
+                messages.append(self.log_queue.get_nowait())
             except queue.Empty:
                 break
 
-        if has_updates:
+        if messages:
+            # One append per refresh; each line still becomes its own block
+            self.log_display.appendPlainText("\n".join(messages))
+
             # Scroll to bottom if we added content
             scrollbar = self.log_display.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
@@ -4,15 +4,15 @@ Main GUI window for clockwork-orange.
 Refactored to use Tree Sidebar navigation.
 """
 import html as html_mod
+import logging
 import re
 import subprocess
 import sys
 from pathlib import Path
 
-import yaml
-from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtCore import QPoint, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import (QAction, QColor, QCursor, QDesktopServices, QFont,
-                         QIcon, QPainter, QPen, QPixmap)
+                         QIcon, QPainter, QPen, QPixmap, QPolygon)
 from PyQt6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QLabel,
                              QMainWindow, QMenu, QPushButton, QSplitter,
                              QStackedWidget, QSystemTrayIcon, QTextBrowser,
@@ -20,7 +20,7 @@ from PyQt6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QLabel,
                              QTreeWidgetItemIterator)
 from PyQt6.QtWidgets import QVBoxLayout as QVBoxLayoutDialog
 
-from config_migrations import load_and_migrate
+from config_migrations import load_and_migrate, save_config
 from plugin_manager import PluginManager
 
 from .blacklist_tab import BlacklistTab
@@ -30,6 +30,8 @@ from .service_manager import ServiceManagerWidget
 from .settings_widgets import (AdvancedSettingsWidget, BasicSettingsWidget,
                                YamlEditorWidget)
 
+log = logging.getLogger("clockwork.gui")
+
 
 # Worker thread for wallpaper changes
 class WallpaperWorker(QThread):
@@ -405,15 +407,19 @@ class AboutDialog(QDialog):
         painter.setPen(QColor(0, 0, 0))  # Black
         painter.setBrush(QColor(0, 0, 0))
 
+        # Each hand is a thin wedge from the center to an arrow tip, drawn as
+        # one filled convex polygon rather than a fan of separate lines
+        center = QPoint(64, 64)
+
         # Hour hand (pointing to 3)
-        painter.drawLine(64, 64, 90, 64)
-        painter.drawLine(64, 64, 88, 60)
-        painter.drawLine(64, 64, 88, 68)
+        painter.drawConvexPolygon(
+            QPolygon([center, QPoint(88, 60), QPoint(90, 64), QPoint(88, 68)])
+        )
 
         # Minute hand (pointing to 12)
-        painter.drawLine(64, 64, 64, 30)
-        painter.drawLine(64, 64, 60, 34)
-        painter.drawLine(64, 64, 68, 34)
+        painter.drawConvexPolygon(
+            QPolygon([center, QPoint(60, 34), QPoint(64, 30), QPoint(68, 34)])
+        )
 
         # Center dot
         painter.setBrush(QColor(0, 0, 0))
@@ -784,7 +790,7 @@ class ClockworkOrangeGUI(QMainWindow):
 
     def perform_auto_save(self):
         """Gather config from all widgets and save."""
-        print("[DEBUG] Auto-saving...")
+        log.debug("Auto-saving...")
 
         # Gather from settings widgets
         self.config_data.update(self.basic_settings.get_config())
@@ -803,8 +809,7 @@ class ClockworkOrangeGUI(QMainWindow):
 
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w") as f:
-                yaml.dump(self.config_data, f, default_flow_style=False, sort_keys=True)
+            save_config(self.config_data, self.config_path)
 
             # Notify
             if self.tray_icon:
@@ -925,7 +930,7 @@ class ClockworkOrangeGUI(QMainWindow):
         height = self.config_data.get("window_height", 600)
         self.resize(width, height)
         self.center_window()
-        print(f"[DEBUG] Window restored to {width}x{height} at {self.pos()}")
+        log.debug("Window restored to %sx%s at %s", width, height, self.pos())
 
     def save_window_geometry(self):
         self.config_data["window_width"] = self.width()
@@ -961,7 +966,7 @@ class ClockworkOrangeGUI(QMainWindow):
         QApplication.quit()
 
     def _signal_handler(self, signum, frame):
-        print(f"\n[DEBUG] Received signal {signum}, shutting down gracefully...")
+        log.debug("Received signal %s, shutting down gracefully...", signum)
         self.quit_application()
 
     def show_window(self):
@@ -1029,15 +1034,15 @@ def main():
         import platform_utils
 
         start_time = time.time()
-        print(f"[DEBUG] Checking for existing instances...")
+        log.debug("Checking for existing instances...")
 
         # Use fast Named Mutex (Windows) or File Lock (Linux)
         # This is instant compared to iterating processes
         if not platform_utils.acquire_instance_lock("clockwork_orange_gui_lock"):
-            print("[DEBUG] Another instance is already running (Lock held)")
+            log.debug("Another instance is already running (Lock held)")
             return 0
 
-        print(f"[DEBUG] Instance check took {time.time() - start_time:.4f}s")
+        log.debug("Instance check took %.4fs", time.time() - start_time)
     except Exception as e:
         print(f"[WARNING] Failed to check for existing instances: {e}")
 
@@ -1052,7 +1057,7 @@ def main():
         )
 
     window.show()
-    print(f"[DEBUG] Window shown. Geometry: {window.geometry()}")
+    log.debug("Window shown. Geometry: %s", window.geometry())
 
     # Force window to front
     window.raise_()
@@ -2,6 +2,7 @@
 """
 Plugin management widget (SinglePluginWidget) for the GUI.
 """
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +21,9 @@ from PyQt6.QtWidgets import (QCheckBox, QComboBox, QDialog, QDialogButtonBox,
 sys.path.append(str(Path(__file__).parent.parent))
 from plugin_manager import PluginManager
 
+# Image formats shown in the review panel
+REVIEW_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp"})
+
 
 def get_relative_time(dt):
     """Return a friendly relative time string."""
@@ -1043,17 +1047,25 @@ class SinglePluginWidget(QWidget):
             self.watcher.addPath(dir_str)
 
         # Collect, filter, and sort with race condition handling
+        # The suffix comes from the bare name, so no Path is built for
+        # entries that are filtered out.
         images_and_times = []
-        for f in download_dir.glob("*"):
-            if f.suffix.lower() in (".jpg", ".jpeg", ".png", ".webp", ".bmp"):
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                # glob("*") skipped hidden files; keep doing so
+                if entry.name.startswith("."):
+                    continue
+                _, dot, ext = entry.name.rpartition(".")
+                if not dot or f".{ext.lower()}" not in REVIEW_IMAGE_EXTENSIONS:
+                    continue
                 try:
-                    mtime = f.stat().st_mtime
-                    images_and_times.append((f, mtime))
+                    mtime = entry.stat().st_mtime
+                    images_and_times.append((Path(entry.path), mtime))
                 except FileNotFoundError:
-                    # File disappeared between glob and stat
+                    # File disappeared between scandir and stat
                     continue
                 except Exception as e:
-                    print(f"[ERROR] Failed to stat file {f}: {e}")
+                    print(f"[ERROR] Failed to stat file {entry.path}: {e}")
                     continue
 
         # Sort by mtime (descending)
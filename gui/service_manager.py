@@ -3,6 +3,7 @@
 Service management GUI widget for clockwork-orange
 """
 
+import logging
 import subprocess
 from pathlib import Path
 
@@ -14,6 +15,8 @@ from PyQt6.QtWidgets import (QCheckBox, QGroupBox, QHBoxLayout, QLabel,
 
 import platform_utils
 
+log = logging.getLogger("clockwork.gui")
+
 
 class ServiceStatusThread(QThread):
     """Thread for checking service status"""
@@ -187,7 +190,7 @@ class ServiceManagerWidget(QWidget):
                     self.toggle_auto_update(True)
 
         except Exception as e:
-            print(f"[DEBUG] Failed to load configuration: {e}")
+            log.debug("Failed to load configuration: %s", e)
 
     def save_auto_update_state(self, enabled):
         """Save auto-update state to configuration file"""
@@ -195,6 +198,7 @@ class ServiceManagerWidget(QWidget):
             from pathlib import Path
 
             import yaml
+            from config_migrations import SafeLoader, save_config
 
             config_path = Path.home() / ".config" / "clockwork-orange.yml"
             config = {}
@@ -202,9 +206,11 @@ class ServiceManagerWidget(QWidget):
             # Load existing config if it exists
             if config_path.exists():
                 with open(config_path, "r") as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=SafeLoader) or {}
 
             # Update auto-update state
+            if bool(config.get("auto_update_logs")) == enabled:
+                return  # Already saved; don't wake the service's watcher
             if enabled:
                 config["auto_update_logs"] = True
             else:
@@ -212,11 +218,10 @@ class ServiceManagerWidget(QWidget):
 
             # Save config
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=True)
+            save_config(config, config_path)
 
         except Exception as e:
-            print(f"[DEBUG] Failed to save auto-update state: {e}")
+            log.debug("Failed to save auto-update state: %s", e)
 
     def refresh_status(self):
         """Refresh service status"""
@@ -341,7 +346,7 @@ class ServiceManagerWidget(QWidget):
                 import shutil
 
                 shutil.copy2(user_config, public_config)
-                print(f"[DEBUG] Synced config to {public_config}")
+                log.debug("Synced config to %s", public_config)
         except Exception as e:
             print(f"[ERROR] Failed to sync config: {e}")
             # Don't show popup as this is background op, just log
@@ -11,6 +11,8 @@ from PyQt6.QtWidgets import (QCheckBox, QFontComboBox, QFormLayout,
                              QHBoxLayout, QLineEdit, QMessageBox, QPushButton,
                              QSpinBox, QTextEdit, QVBoxLayout, QWidget)
 
+from config_migrations import SafeDumper, SafeLoader
+
 
 class BasicSettingsWidget(QWidget):
     """Widget for basic settings"""
@@ -256,7 +258,10 @@ class YamlEditorWidget(QWidget):
     def update_display(self):
         try:
             yaml_text = yaml.dump(
-                self.config_data, default_flow_style=False, sort_keys=True
+                self.config_data,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=True,
             )
             self.yaml_edit.setText(yaml_text)
         except Exception as e:
@@ -268,15 +273,17 @@ class YamlEditorWidget(QWidget):
 
     def validate_yaml(self):
         try:
-            yaml.safe_load(self.yaml_edit.toPlainText())
+            yaml.load(self.yaml_edit.toPlainText(), Loader=SafeLoader)
             QMessageBox.information(self, "Success", "YAML syntax is valid!")
         except yaml.YAMLError as e:
             QMessageBox.critical(self, "YAML Error", f"Invalid YAML syntax: {e}")
 
     def format_yaml(self):
         try:
-            data = yaml.safe_load(self.yaml_edit.toPlainText())
-            formatted = yaml.dump(data, default_flow_style=False, sort_keys=True)
+            data = yaml.load(self.yaml_edit.toPlainText(), Loader=SafeLoader)
+            formatted = yaml.dump(
+                data, Dumper=SafeDumper, default_flow_style=False, sort_keys=True
+            )
             self.yaml_edit.setText(formatted)
             QMessageBox.information(self, "Success", "YAML formatted successfully!")
         except yaml.YAMLError as e:
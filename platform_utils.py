@@ -1,7 +1,10 @@
+import json
+import logging
 import os
 import subprocess
 import sys
 from pathlib import Path
+from string import Template
 
 # Windows specific flag to hide console window when spawning processes
 # This prevents blank CMD windows from popping up in GUI applications
@@ -9,6 +12,10 @@ CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
 
 # Note: import ctypes moved to function scope to avoid PyInstaller freeze issues?
 
+# Child of the main "clockwork" logger, so CO_DEBUG and the debug setting apply
+# here too
+log = logging.getLogger("clockwork.platform")
+
 IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 IS_LINUX = sys.platform == "linux"
@@ -26,11 +33,21 @@ def is_linux():
     return IS_LINUX
 
 
+def _absolute(path) -> Path:
+    """Return path as an absolute Path, resolving only relative paths.
+
+    Callers mostly pass paths built from already-resolved sources, for which
+    resolve() would just re-walk every component.
+    """
+    path = Path(path)
+    return path if path.is_absolute() else path.resolve()
+
+
 def set_wallpaper(image_path: Path) -> bool:
     """
     Set the desktop wallpaper.
     """
-    image_path = image_path.resolve()
+    image_path = _absolute(image_path)
 
     if IS_WINDOWS:
         return _set_wallpaper_windows(image_path)
@@ -66,9 +83,7 @@ def get_monitor_count() -> int:
 
             return len(screeninfo.get_monitors())
         except Exception as e:
-            print(
-                f"[DEBUG] Failed to get monitor count via screeninfo, assuming 1: {e}"
-            )
+            log.debug("Failed to get monitor count via screeninfo, assuming 1: %s", e)
             return 1
     elif IS_MACOS:
         return _get_monitor_count_macos()
@@ -84,13 +99,13 @@ def get_monitor_count() -> int:
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             count = int(result.stdout.strip())
-            print(f"[DEBUG] Detected {count} monitors")
+            log.debug("Detected %s monitors", count)
             return count
         except (subprocess.CalledProcessError, ValueError) as e:
-            print(f"[DEBUG] Failed to detect monitor count: {e}")
+            log.debug("Failed to detect monitor count: %s", e)
             return 1
         except FileNotFoundError:
-            print(f"[DEBUG] qdbus6 not found, assuming 1 monitor")
+            log.debug("qdbus6 not found, assuming 1 monitor")
             return 1
 
 
@@ -136,7 +151,7 @@ def set_wallpaper_multi_monitor(image_paths: list) -> bool:
             {"x": m.x, "y": m.y, "w": m.width, "h": m.height} for m in monitors_obj
         ]
 
-        print(f"[DEBUG] Stitching wallpapers for {len(monitors)} monitor(s)")
+        log.debug("Stitching wallpapers for %s monitor(s)", len(monitors))
 
         # 2. Determine canvas bounding box
         min_x = min(m["x"] for m in monitors)
@@ -220,7 +235,7 @@ def set_wallpaper_multi_monitor(image_paths: list) -> bool:
         SPIF_UPDATEINIFILE = 0x01
         SPIF_SENDWININICHANGE = 0x02
 
-        print(f"[DEBUG] Applying spanned wallpaper: {spanned_path}")
+        log.debug("Applying spanned wallpaper: %s", spanned_path)
         result = ctypes.windll.user32.SystemParametersInfoW(
             SPI_SETDESKWALLPAPER,
             0,
@@ -239,7 +254,7 @@ def set_wallpaper_multi_monitor(image_paths: list) -> bool:
 
 def _set_wallpaper_windows(image_path: Path) -> bool:
     """Set wallpaper on Windows (single monitor or all monitors)."""
-    print(f"[DEBUG] Setting Windows wallpaper: {image_path}")
+    log.debug("Setting Windows wallpaper: %s", image_path)
     if not image_path.exists():
         print(f"[ERROR] File does not exist: {image_path}")
         return False
@@ -248,8 +263,8 @@ def _set_wallpaper_windows(image_path: Path) -> bool:
     try:
         return set_wallpaper_multi_monitor([image_path])
     except Exception as e:
-        print(
-            f"[DEBUG] Multi-monitor API failed, falling back to SystemParametersInfoW: {e}"
+        log.debug(
+            "Multi-monitor API failed, falling back to SystemParametersInfoW: %s", e
         )
 
     # Fallback to SystemParametersInfoW
@@ -278,43 +293,109 @@ def _set_wallpaper_windows(image_path: Path) -> bool:
 # --- Linux Implementations (Moved from clockwork-orange.py) ---
 
 
-def _set_wallpaper_linux(p: Path) -> bool:
-    print(f"[DEBUG] Setting KDE wallpaper from path: {p}")
-    if not p.exists():
-        print(f"[ERROR] File does not exist: {p}")
+# Session bus connection for in-process D-Bus calls (jeepney, optional).
+# None = not tried yet, False = unavailable, so we use qdbus6 instead.
+_SESSION_BUS = None
+
+
+def _get_session_bus():
+    global _SESSION_BUS
+    if _SESSION_BUS is None:
+        try:
+            from jeepney.io.blocking import open_dbus_connection
+
+            _SESSION_BUS = open_dbus_connection(bus="SESSION")
+        except Exception:
+            _SESSION_BUS = False
+    return _SESSION_BUS or None
+
+
+def _dbus_call(service: str, path: str, method: str, *args: str) -> bool:
+    """Call a session bus method, equivalent to `qdbus6 service path method args`.
+
+    `method` is the fully qualified interface.member name and all arguments
+    are strings. The call goes over a cached jeepney connection when jeepney
+    is installed, avoiding a qdbus6 fork/exec and Qt startup per call, and
+    falls back to spawning qdbus6 otherwise.
+    """
+    global _SESSION_BUS
+    bus = _get_session_bus()
+    if bus is not None:
+        from jeepney import DBusAddress, DBusErrorResponse, new_method_call
+        from jeepney.wrappers import unwrap_msg
+
+        interface, _, member = method.rpartition(".")
+        address = DBusAddress(path, bus_name=service, interface=interface)
+        msg = new_method_call(address, member, "s" * len(args), args)
+        try:
+            unwrap_msg(bus.send_and_get_reply(msg, timeout=30))
+            return True
+        except DBusErrorResponse as e:
+            print(f"[ERROR] D-Bus call {method} failed: {e}")
+            return False
+        except Exception as e:
+            # Connection dropped or timed out; use qdbus6 from now on
+            print(f"[WARN] D-Bus connection failed ({e}), falling back to qdbus6")
+            bus.close()
+            _SESSION_BUS = False
+
+    try:
+        subprocess.run(
+            ["qdbus6", service, path, method, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"[ERROR] qdbus6 failed: {e.stderr}")
+        return False
+    except FileNotFoundError:
+        print("[ERROR] qdbus6 not found.")
         return False
 
-    script = """
+
+# Plasma scripts for org.kde.PlasmaShell.evaluateScript. Placeholders are
+# filled with json.dumps() output, which is a valid JS literal with quotes in
+# file names escaped.
+KDE_WALLPAPER_SCRIPT = Template("""
     desktops().forEach(d => {
         d.currentConfigGroup = Array("Wallpaper",
                                      "org.kde.image",
                                      "General");
-        d.writeConfig("Image", "file://FILEPATH");
+        d.writeConfig("Image", $image);
         d.reloadConfig();
     });
-    """.replace(
-        "FILEPATH", str(p)
-    )
+    """)
+
+KDE_MULTI_MONITOR_SCRIPT = Template("""
+    var allDesktops = desktops();
+    var images = $images;
+
+    for (var i = 0; i < allDesktops.length; i++) {
+        var d = allDesktops[i];
+        d.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");
+        var img = images[i % images.length];
+        d.writeConfig("Image", img);
+        d.reloadConfig();
+    }
+    """)
+
+
+def _set_wallpaper_linux(p: Path) -> bool:
+    log.debug("Setting KDE wallpaper from path: %s", p)
+    if not p.exists():
+        print(f"[ERROR] File does not exist: {p}")
+        return False
 
-    cmd = [
-        "qdbus6",
+    script = KDE_WALLPAPER_SCRIPT.substitute(image=json.dumps(f"file://{p}"))
+
+    return _dbus_call(
         "org.kde.plasmashell",
         "/PlasmaShell",
         "org.kde.PlasmaShell.evaluateScript",
         script,
-    ]
-
-    try:
-        # We don't check=True here to allow graceful failure handling if qdbus6 is missing
-        # But wait, original code did check=True inside a try/except for CalledProcessError
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"[ERROR] qdbus6 failed: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print(f"[ERROR] qdbus6 not found.")
-        return False
+    )
 
 
 def _set_wallpaper_multi_monitor_linux(image_paths: list) -> bool:
@@ -325,7 +406,7 @@ def _set_wallpaper_multi_monitor_linux(image_paths: list) -> bool:
     # Resolve all paths and validate
     resolved_paths = []
     for p in image_paths:
-        path = Path(p).resolve()
+        path = _absolute(p)
         if not path.exists():
             print(f"[ERROR] File does not exist: {path}")
             continue
@@ -334,80 +415,222 @@ def _set_wallpaper_multi_monitor_linux(image_paths: list) -> bool:
     if not resolved_paths:
         return False
 
-    print(f"[DEBUG] Setting wallpapers for multiple monitors: {resolved_paths}")
-
-    # Create JS array string: '["file://...", "file://..."]'
-    js_images = ", ".join([f'"file://{p}"' for p in resolved_paths])
+    log.debug("Setting wallpapers for multiple monitors: %s", resolved_paths)
 
-    script = f"""
-    var allDesktops = desktops();
-    var images = [{js_images}];
-
-    for (var i = 0; i < allDesktops.length; i++) {{
-        var d = allDesktops[i];
-        d.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");
-        var img = images[i % images.length];
-        d.writeConfig("Image", img);
-        d.reloadConfig();
-    }}
-    """
+    # JS array literal: ["file://...", "file://..."]
+    script = KDE_MULTI_MONITOR_SCRIPT.substitute(
+        images=json.dumps([f"file://{p}" for p in resolved_paths])
+    )
 
-    cmd = [
-        "qdbus6",
+    return _dbus_call(
         "org.kde.plasmashell",
         "/PlasmaShell",
         "org.kde.PlasmaShell.evaluateScript",
         script,
-    ]
+    )
+
+
+KSCREENLOCKER_IMAGE_GROUP = "Greeter][Wallpaper][org.kde.image][General"
+
+
+def _kscreenlockerrc_path() -> Path:
+    config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(config_home) / "kscreenlockerrc"
+
+
+def _kconfig_escape(value: str) -> str:
+    """Escape a value the way KConfig writes it."""
+    value = (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace("\t", "\\t")
+        .replace("\r", "\\r")
+    )
+    # KConfig strips unescaped whitespace at either end of a value
+    if value.startswith(" "):
+        value = "\\s" + value[1:]
+    if value.endswith(" "):
+        value = value[:-1] + "\\s"
+    return value
+
+
+def replace_file_atomically(path: Path, text: str):
+    """Replace path with text via a synced temp file in the same directory.
+
+    Shared by the kscreenlockerrc editor and config_migrations.save_config.
+    A symlinked path is followed, so the link survives and its target is
+    updated. Each writer gets its own temp file, and a crash mid-write leaves
+    the old file in place rather than a truncated one.
+    """
+    import tempfile
 
+    path = path.resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"[ERROR] qdbus6 command failed: {e.stderr}")
-        return False
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the existing file's mode
+        try:
+            os.chmod(tmp_name, path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _edit_kscreenlockerrc(changes: dict) -> bool:
+    """Apply {(group, key): value} to kscreenlockerrc in one read and write.
+
+    A value of None deletes the key; a key that is set but missing is added to
+    its group, and a missing group is appended. Only those lines change:
+    comments, ordering, line endings and other KConfig syntax are kept byte
+    for byte. Returns False without touching the file if the edit needs
+    KConfig semantics this line editor doesn't implement (immutable [$i]
+    groups, keys with [$e] or locale suffixes) or the file can't be read or
+    written, so the caller can fall back to kwriteconfig6.
+    """
+    config_path = _kscreenlockerrc_path()
+    try:
+        with open(config_path, encoding="utf-8", newline="") as f:
+            original = f.read()
     except FileNotFoundError:
-        print("[ERROR] qdbus6 not found")
+        original = ""
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[WARN] Could not edit {config_path} directly: {e}")
+        return False
+
+    lines = original.splitlines(keepends=True)
+    newline = "\n"
+    if lines and lines[0].endswith("\r\n"):
+        newline = "\r\n"
+
+    groups = {group for group, _ in changes}
+    found = set()
+    out = []
+    insert_at = {}  # group -> index in out just past its last key line
+    group = None
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            group = stripped[1:-1]
+            if group == "$i":
+                return False  # The whole file is immutable
+            if group.endswith("][$i"):
+                group = group[: -len("][$i")]
+                if group in groups:
+                    return False
+            out.append(line)
+            if group in groups:
+                insert_at[group] = len(out)
+            continue
+
+        if group in groups and "=" in stripped and stripped[0] not in "#;":
+            key = stripped.partition("=")[0].strip()
+            base_key = key.partition("[")[0]
+            if (group, base_key) in changes:
+                if key != base_key:
+                    return False
+                found.add((group, key))
+                value = changes[(group, key)]
+                if value is None:
+                    continue
+                ending = line[len(line.rstrip("\r\n")) :] or newline
+                line = f"{key}={_kconfig_escape(value)}{ending}"
+        out.append(line)
+        if group in groups and stripped:
+            insert_at[group] = len(out)
+
+    additions = {}
+    for (group, key), value in changes.items():
+        if value is not None and (group, key) not in found:
+            additions.setdefault(group, []).append(
+                f"{key}={_kconfig_escape(value)}{newline}"
+            )
+    # Insert from the bottom up so earlier indexes stay valid
+    for group in sorted(
+        (g for g in additions if g in insert_at),
+        key=insert_at.get,
+        reverse=True,
+    ):
+        index = insert_at[group]
+        if index and not out[index - 1].endswith(("\n", "\r")):
+            out[index - 1] += newline
+        out[index:index] = additions.pop(group)
+    for group, new_lines in additions.items():
+        if out and not out[-1].endswith(("\n", "\r")):
+            out[-1] += newline
+        if out and out[-1].strip():
+            out.append(newline)
+        out.append(f"[{group}]{newline}")
+        out.extend(new_lines)
+
+    text = "".join(out)
+    if text == original:
+        return True
+    try:
+        replace_file_atomically(config_path, text)
+        return True
+    except OSError as e:
+        print(f"[WARN] Could not edit {config_path} directly: {e}")
         return False
 
 
+def _write_kscreenlocker_image(wallpaper_path: str) -> bool:
+    """Set the lock screen Image key by editing kscreenlockerrc in-process.
+
+    Saves a kwriteconfig6 fork/exec per call. Returns False if the file could
+    not be edited in-process, so the caller can fall back to kwriteconfig6.
+    """
+    return _edit_kscreenlockerrc({(KSCREENLOCKER_IMAGE_GROUP, "Image"): wallpaper_path})
+
+
+def delete_kscreenlocker_keys(entries) -> bool:
+    """Delete (group, key) pairs from kscreenlockerrc in one read and write.
+
+    Groups use the file's own spelling, e.g. KSCREENLOCKER_IMAGE_GROUP for a
+    nested group. A missing file is left missing. Returns False if the file
+    could not be edited in-process, so the caller can fall back to one
+    kwriteconfig6 --delete per key.
+    """
+    return _edit_kscreenlockerrc({(group, key): None for group, key in entries})
+
+
 def _set_lockscreen_wallpaper_linux(image_path: Path) -> bool:
-    image_path = image_path.resolve()
+    image_path = _absolute(image_path)
     if not image_path.exists():
         return False
 
     wallpaper_path = f"file://{image_path}"
 
-    cmd = [
-        "kwriteconfig6",
-        "--file",
-        "kscreenlockerrc",
-        "--group",
-        "Greeter",
-        "--group",
-        "Wallpaper",
-        "--group",
-        "org.kde.image",
-        "--group",
-        "General",
-        "--key",
-        "Image",
-        wallpaper_path,
-    ]
-
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
-        # Assuming clean up and reload logic remains in main or we move it here?
-        # The original code had helper functions like _clean_lockscreen_config inside main.
-        # For now, let's keep the core "set" primitive here.
-        # Ideally we'd move all that logic here but let's start with the basic setter.
-        # Wait, the reload logic is important for it to take effect?
-        # The original code called _reload_screensaver_config() after this.
-        # We should probably expose that too or include it.
-        # Let's include _reload_screensaver_config logic if possible, or leave it to the caller.
-        # The caller (clockwork-orange.py) calls _reload_screensaver_config.
-        # I will expose a 'reload_lockscreen_config' function and call it there?
-        # Or better, just do it here.
+        if not _write_kscreenlocker_image(wallpaper_path):
+            cmd = [
+                "kwriteconfig6",
+                "--file",
+                "kscreenlockerrc",
+                "--group",
+                "Greeter",
+                "--group",
+                "Wallpaper",
+                "--group",
+                "org.kde.image",
+                "--group",
+                "General",
+                "--key",
+                "Image",
+                wallpaper_path,
+            ]
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
 
         _reload_screensaver_config_linux()
         return True
@@ -417,22 +640,24 @@ def _set_lockscreen_wallpaper_linux(image_path: Path) -> bool:
 
 
 def _reload_screensaver_config_linux():
-    # Attempt to reload kscreenlocker
-    # Original code: qdbus6 org.freedesktop.ScreenSaver /ScreenSaver configure
-    # But wait, looking at original code...
-    # It seems it was calling _reload_screensaver_config() which does some qdbus magic.
+    # Ask kscreenlocker to re-read its config. configure() is only exported
+    # on the org.kde.screensaver interface. In-process over jeepney when
+    # available; if that is missing or the call fails, qdbus6 is fired
+    # without waiting for it to exit, since nothing uses the reply.
+    if _get_session_bus() is not None and _dbus_call(
+        "org.freedesktop.ScreenSaver",
+        "/ScreenSaver",
+        "org.kde.screensaver.configure",
+    ):
+        return
 
     try:
-        # Try to find the service/object, it might be different depending on system state
-        # Original code used:
-        # qdbus6 org.freedesktop.ScreenSaver /ScreenSaver configure
-        subprocess.run(
+        subprocess.Popen(
             ["qdbus6", "org.freedesktop.ScreenSaver", "/ScreenSaver", "configure"],
-            capture_output=True,
-            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-
-    except:
+    except OSError:
         pass
 
 
@@ -486,7 +711,7 @@ def _prune_macos_wallpaper_cache():
 
 def _set_wallpaper_macos(image_path: Path) -> bool:
     """Set wallpaper on macOS using NSWorkspace."""
-    print(f"[DEBUG] Setting macOS wallpaper: {image_path}")
+    log.debug("Setting macOS wallpaper: %s", image_path)
     if not image_path.exists():
         print(f"[ERROR] File does not exist: {image_path}")
         return False
@@ -532,7 +757,7 @@ def _get_monitor_count_macos() -> int:
         import AppKit
 
         count = len(AppKit.NSScreen.screens())
-        print(f"[DEBUG] Detected {count} monitors (macOS)")
+        log.debug("Detected %s monitors (macOS)", count)
         return count
     except ImportError:
         try:
@@ -548,7 +773,7 @@ def _get_monitor_count_macos() -> int:
             )
             return int(result.stdout.strip())
         except Exception as e:
-            print(f"[DEBUG] Failed to detect monitor count on macOS: {e}")
+            log.debug("Failed to detect monitor count on macOS: %s", e)
             return 1
 
 
@@ -756,6 +981,57 @@ def _service_get_logs_linux() -> str:
         return f"Error retrieving logs: {e}"
 
 
+# --- Filesystem ---
+
+# Filesystem types whose change notifications are missing or unreliable
+NETWORK_FILESYSTEMS = frozenset(
+    {"cifs", "smb3", "smbfs", "nfs", "nfs4", "fuse.sshfs", "9p", "afs"}
+)
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    Return True if path is on a network share (SMB/CIFS, NFS, ...).
+    Best effort: returns False when the filesystem type cannot be determined.
+    """
+    try:
+        if IS_WINDOWS:
+            return _is_network_path_windows(path)
+        elif IS_LINUX:
+            return _is_network_path_linux(path)
+    except Exception as e:
+        log.debug("Could not determine filesystem type of %s: %s", path, e)
+    return False
+
+
+def _is_network_path_windows(path: Path) -> bool:
+    import ctypes
+
+    DRIVE_REMOTE = 4
+    drive = os.path.splitdrive(str(path.resolve()))[0]
+    if not drive:
+        return False
+    # UNC paths have the share as their "drive"; both need a trailing slash
+    return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+
+
+def _is_network_path_linux(path: Path) -> bool:
+    target = str(path.resolve())
+    best_mount, best_type = "", ""
+    with open("/proc/self/mounts") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 3:
+                continue
+            # Spaces and tabs in mount points are octal-escaped
+            mount = fields[1].replace("\\040", " ").replace("\\011", "\t")
+            under = target == mount or target.startswith(mount.rstrip("/") + "/")
+            # Later mounts shadow earlier ones at the same point
+            if under and len(mount) >= len(best_mount):
+                best_mount, best_type = mount, fields[2]
+    return best_type in NETWORK_FILESYSTEMS
+
+
 # --- Instance Locking ---
 global_lock_handle = None
 
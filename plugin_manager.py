@@ -79,14 +79,13 @@ class PluginManager:
             self.plugins_dir = plugins_dir
 
         self.plugins = {}
+        # Loaded plugin modules by name. The GUI asks for a plugin's schema and
+        # description separately; each used to re-execute the plugin source.
+        self._modules = {}
         self.discover_plugins()
 
     def discover_plugins(self):
         """Find available plugins in the plugins directory."""
-        if not self.plugins_dir.exists():
-            print(f"[ERROR] Plugins directory not found: {self.plugins_dir}")
-            return
-
         # Look for python files in the plugins directory
         # In frozen state, we might rely on known imports, but iterating dir works
         # if PyInstaller collected them as data or separate files.
@@ -94,15 +93,24 @@ class PluginManager:
 
         # print(f"[DEBUG] Discovering plugins in {self.plugins_dir}")
 
-        for item in self.plugins_dir.iterdir():
+        # scandir's DirEntry.is_file() is answered from the directory listing,
+        # and the name checks come first, so most entries cost no stat()
+        try:
+            entries = list(os.scandir(self.plugins_dir))
+        except OSError:
+            print(f"[ERROR] Plugins directory not found: {self.plugins_dir}")
+            return
+
+        for entry in entries:
+            name = entry.name
             if (
-                item.is_file()
-                and item.suffix == ".py"
-                and item.name not in ["__init__.py", "base.py", "blacklist.py"]
-                and not item.name.startswith("_")
+                name.endswith(".py")
+                and name not in ("__init__.py", "base.py", "blacklist.py")
+                and not name.startswith("_")
+                and entry.is_file()
             ):
-                plugin_name = item.stem
-                self.plugins[plugin_name] = item
+                plugin_name = name[:-3]
+                self.plugins[plugin_name] = self.plugins_dir / name
                 # print(f"[DEBUG] Found plugin: {plugin_name}")
 
     def get_available_plugins(self) -> List[str]:
@@ -114,7 +122,11 @@ class PluginManager:
         return self.plugins.get(plugin_name)
 
     def _load_plugin_module(self, plugin_name: str):
-        """Dynamically load the plugin module."""
+        """Dynamically load the plugin module (once per manager)."""
+        module = self._modules.get(plugin_name)
+        if module is not None:
+            return module
+
         plugin_path = self.get_plugin_path(plugin_name)
         if not plugin_path:
             raise ValueError(f"Plugin not found: {plugin_name}")
@@ -128,6 +140,7 @@ class PluginManager:
                 module = importlib.util.module_from_spec(spec)
                 sys.modules[spec.name] = module
                 spec.loader.exec_module(module)
+                self._modules[plugin_name] = module
                 return module
             else:
                 raise ImportError(f"Could not load spec for {plugin_name}")
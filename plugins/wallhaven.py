@@ -4,6 +4,7 @@ Wallhaven Plugin for Clockwork Orange.
 Downloads wallpapers from Wallhaven.cc API v1.
 """
 
+import os
 import sys
 import time
 from datetime import datetime, timedelta
@@ -393,13 +394,15 @@ class WallhavenPlugin(PluginBase):
 
     def _cleanup_old_files(self, download_dir: Path, max_files: int):
         try:
-            files = sorted(
-                [f for f in download_dir.iterdir() if f.is_file()],
-                key=lambda f: f.stat().st_mtime,
-            )
+            # DirEntry caches its type and stat, so each file is stat()ed once
+            with os.scandir(download_dir) as it:
+                files = sorted(
+                    [entry for entry in it if entry.is_file()],
+                    key=lambda entry: entry.stat().st_mtime,
+                )
             if len(files) > max_files:
-                for f in files[: len(files) - max_files]:
-                    f.unlink()
+                for entry in files[: len(files) - max_files]:
+                    os.unlink(entry.path)
         except Exception:
             pass
 
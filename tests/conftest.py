@@ -0,0 +1,31 @@
+"""Shared pytest setup for the test suite.
+
+Puts the repository root on sys.path so the top-level modules (platform_utils,
+plugin_manager, config_migrations, ...) import directly, and loads the
+hyphenated clockwork-orange.py once as the module clockwork_orange_main. Test
+files import it by that name instead of each loading their own copy.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MAIN_MODULE_NAME = "clockwork_orange_main"
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _load_main_module():
+    """Load the hyphenated main script as an importable module."""
+    spec = importlib.util.spec_from_file_location(
+        MAIN_MODULE_NAME, REPO_ROOT / "clockwork-orange.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[MAIN_MODULE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+if MAIN_MODULE_NAME not in sys.modules:
+    _load_main_module()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Tests for command-line parsing in the main script.
+
+Plugins are only discovered when a command needs them (--plugin, --help), yet
+--plugin still accepts discovered names and rejects unknown ones with the
+usual argparse "invalid choice" error.
+"""
+import io
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+
+import clockwork_orange_main as co  # loaded by conftest.py
+
+
+class TestArgumentParser(unittest.TestCase):
+    """_create_argument_parser with the deferred --plugin check."""
+
+    def _parse(self, argv):
+        parser = co._create_argument_parser(argv)
+        args = parser.parse_args(argv)
+        co._check_plugin_choice(parser, args)
+        return args
+
+    def test_non_plugin_flags_skip_plugin_discovery(self):
+        """Building the parser for --gui does not scan the plugins."""
+        with mock.patch.object(co, "_get_plugin_manager") as get_pm:
+            args = self._parse(["--gui"])
+
+        get_pm.assert_not_called()
+        self.assertTrue(args.gui)
+
+    def test_known_plugin_is_accepted(self):
+        """A discovered plugin name passes validation."""
+        self.assertEqual(self._parse(["--plugin", "local"]).plugin, "local")
+
+    def test_unknown_plugin_is_rejected(self):
+        """An unknown plugin name is a usage error, as with choices=."""
+        with redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                self._parse(["--plugin", "does_not_exist"])
+
+        self.assertIn("invalid choice", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""Tests for reading and writing the YAML config file.
+
+load_config_file keeps the last parse keyed on the file's mtime and size:
+an unchanged file is not parsed again, an edit (or an explicit invalidation)
+is, and callers get copies they can mutate. save_config writes atomically and
+leaves a file that already holds the same YAML untouched.
+"""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import clockwork_orange_main as co  # loaded by conftest.py
+import config_migrations
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """load_config_file parses once per file version."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self._tmp.name)
+        self.config_path = self.home / ".config" / "clockwork-orange.yml"
+        self.config_path.parent.mkdir()
+        co._CONFIG_CACHE.update(key=None, config={})
+        patcher = mock.patch.object(co.Path, "home", return_value=self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, text, mtime_ns):
+        self.config_path.write_text(text)
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_is_not_reparsed(self):
+        """A second load of an unchanged file does not parse it again."""
+        self._write("default_wait: 60\n", 1_000_000_000)
+        first = co.load_config_file()
+
+        with mock.patch("config_migrations.load_and_migrate") as load:
+            second = co.load_config_file()
+
+        load.assert_not_called()
+        self.assertEqual(second, {"default_wait": 60})
+        self.assertEqual(first, second)
+
+    def test_cached_config_is_isolated_from_callers(self):
+        """Mutating a returned config does not leak into later loads."""
+        self._write("plugins:\n  wallhaven:\n    enabled: true\n", 1_000_000_000)
+
+        co.load_config_file()["plugins"].clear()
+
+        self.assertIn("wallhaven", co.load_config_file()["plugins"])
+
+    def test_modified_file_is_reloaded(self):
+        """A new mtime forces the file to be read again."""
+        self._write("default_wait: 60\n", 1_000_000_000)
+        co.load_config_file()
+
+        self._write("default_wait: 120\n", 2_000_000_000)
+
+        self.assertEqual(co.load_config_file(), {"default_wait": 120})
+
+    def test_invalidate_forces_reload_of_same_stat_edit(self):
+        """An edit with identical mtime and size is seen once invalidated."""
+        self._write("default_wait: 60\n", 1_000_000_000)
+        co.load_config_file()
+
+        self._write("default_wait: 90\n", 1_000_000_000)
+        self.assertEqual(co.load_config_file(), {"default_wait": 60})
+
+        co._invalidate_config_cache()
+        self.assertEqual(co.load_config_file(), {"default_wait": 90})
+
+    def test_non_json_values_survive_the_cache(self):
+        """YAML-only types (dates, integer keys) come back unchanged."""
+        self._write("last_run: 2024-01-02\nsizes:\n  1: small\n", 1_000_000_000)
+
+        first = co.load_config_file()
+        second = co.load_config_file()
+
+        self.assertEqual(first, second)
+        self.assertIn(1, second["sizes"])
+
+    def test_missing_file_returns_empty_config(self):
+        """Without a config file the defaults (an empty dict) are used."""
+        self.assertEqual(co.load_config_file(), {})
+
+
+class TestSaveConfig(unittest.TestCase):
+    """save_config round-trips and skips no-op rewrites."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.config_path = Path(self._tmp.name) / "clockwork-orange.yml"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trips_through_yaml(self):
+        """A saved config loads back unchanged."""
+        config = {"default_wait": 60, "plugins": {"local": {"enabled": True}}}
+
+        self.assertTrue(config_migrations.save_config(config, self.config_path))
+
+        self.assertEqual(config_migrations.load_and_migrate(self.config_path), config)
+
+    def test_identical_config_is_not_rewritten(self):
+        """Saving the same data again leaves the file untouched."""
+        config_migrations.save_config({"default_wait": 60}, self.config_path)
+        os.utime(self.config_path, ns=(1_000_000_000, 1_000_000_000))
+
+        self.assertFalse(config_migrations.save_config({"default_wait": 60}, self.config_path))
+        self.assertEqual(self.config_path.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_changed_config_is_written(self):
+        """Different data replaces the file."""
+        config_migrations.save_config({"default_wait": 60}, self.config_path)
+
+        self.assertTrue(config_migrations.save_config({"default_wait": 120}, self.config_path))
+        self.assertEqual(self.config_path.read_text(), "default_wait: 120\n")
+
+    def test_symlinked_config_keeps_its_link(self):
+        """Saving through a symlink updates the target, not the link."""
+        target = Path(self._tmp.name) / "dotfiles" / "clockwork-orange.yml"
+        target.parent.mkdir()
+        target.write_text("default_wait: 60\n")
+        self.config_path.symlink_to(target)
+
+        self.assertTrue(config_migrations.save_config({"default_wait": 120}, self.config_path))
+
+        self.assertTrue(self.config_path.is_symlink())
+        self.assertEqual(target.read_text(), "default_wait: 120\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,29 +5,17 @@ Verifies that a burst of rapid config-file writes (as happens at login) is
 coalesced into a single trigger, while a settled single change still triggers
 promptly. See specs/009-config-watcher-debounce.md.
 """
-import importlib.util
-import sys
+import io
+import tempfile
 import threading
 import time
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-REPO_ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_main_module():
-    """Load the hyphenated main script as an importable module."""
-    if str(REPO_ROOT) not in sys.path:
-        sys.path.insert(0, str(REPO_ROOT))
-    spec = importlib.util.spec_from_file_location(
-        "clockwork_orange_main", REPO_ROOT / "clockwork-orange.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-co = _load_main_module()
+import clockwork_orange_main as co  # loaded by conftest.py
 
 
 class TestConfigDebounce(unittest.TestCase):
@@ -102,5 +90,146 @@ class TestConfigDebounce(unittest.TestCase):
         self.assertLess(elapsed, 1.0)
 
 
+class TestWaitForNextCycle(unittest.TestCase):
+    """The dynamic-mode wait drains bursts and survives bad intervals."""
+
+    def setUp(self):
+        co.shutdown_event.clear()
+        self.addCleanup(co.shutdown_event.clear)
+
+    def test_shutdown_signal_interrupts_wait(self):
+        """The signal handler wakes a long config-aware wait immediately."""
+        timer = threading.Timer(0.1, co.signal_handler, args=(15, None))
+        # signal_handler sets the module-level event; wait on that one
+        self.addCleanup(co.config_change_event.clear)
+        co.config_change_event.clear()
+
+        start = time.monotonic()
+        timer.start()
+        co._wait_for_next_cycle({}, 30, co.config_change_event)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(co.shutdown_event.is_set())
+
+    def test_times_out_without_changes(self):
+        """With no change or signal the wait lasts the configured interval."""
+        event = threading.Event()
+
+        start = time.monotonic()
+        co._wait_for_next_cycle({}, 0.2, event)
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 1.0)
+
+    def test_negative_config_interval_falls_back_to_default(self):
+        """A negative default_wait does not turn the wait into a busy loop."""
+        event = threading.Event()
+
+        start = time.monotonic()
+        with redirect_stdout(io.StringIO()):
+            co._wait_for_next_cycle({"default_wait": -5}, 0.2, event)
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.18)
+
+
+class TestConfigWatcher(unittest.TestCase):
+    """ConfigWatcher only reacts to events for the config file."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.config_path = self.dir / "clockwork-orange.yml"
+        self.event = threading.Event()
+        self.watcher = co.ConfigWatcher(self.config_path, self.event)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _dispatch(self, event_type, src, dest=""):
+        self.watcher.dispatch(
+            SimpleNamespace(event_type=event_type, src_path=str(src), dest_path=str(dest))
+        )
+
+    def test_config_write_triggers(self):
+        """A write to the config file sets the change event."""
+        self._dispatch("modified", self.config_path)
+        self.assertTrue(self.event.is_set())
+
+    def test_atomic_replace_triggers(self):
+        """Renaming a temp file over the config sets the change event."""
+        self._dispatch("moved", self.dir / "tmp123.yml", self.config_path)
+        self.assertTrue(self.event.is_set())
+
+    def test_exact_config_path_skips_resolve(self):
+        """The configured path itself matches without touching the filesystem."""
+        with mock.patch.object(co.Path, "resolve", side_effect=AssertionError):
+            self._dispatch("modified", self.config_path)
+        self.assertTrue(self.event.is_set())
+
+    def test_event_filter_covers_handled_event_types(self):
+        """The observer filter lets through every event type dispatch() handles."""
+        types = {cls.event_type for cls in self.watcher.event_filter()}
+        self.assertEqual(types, {"modified", "created", "moved"})
+
+    def test_schedule_passes_event_filter(self):
+        """The observer is asked to filter events when it supports that."""
+        observer = mock.Mock()
+
+        co._schedule_config_watcher(observer, self.watcher, self.dir)
+
+        observer.schedule.assert_called_once_with(
+            self.watcher,
+            str(self.dir),
+            recursive=False,
+            event_filter=self.watcher.event_filter(),
+        )
+
+    def test_schedule_without_event_filter_support(self):
+        """watchdog before 4.0 rejects event_filter; the watch is added without it."""
+
+        def old_schedule(event_handler, path, recursive=False):
+            return None
+
+        observer = mock.Mock()
+        observer.schedule.side_effect = mock.create_autospec(old_schedule)
+
+        co._schedule_config_watcher(observer, self.watcher, self.dir)
+
+        self.assertEqual(observer.schedule.call_count, 2)
+        observer.schedule.assert_called_with(self.watcher, str(self.dir), recursive=False)
+
+    def test_symlinked_config_target_triggers(self):
+        """A write to the target of a symlinked config sets the change event."""
+        target = self.dir / "real-config.yml"
+        target.write_text("default_wait: 60\n")
+        self.config_path.symlink_to(target)
+        watcher = co.ConfigWatcher(self.config_path, self.event)
+
+        watcher.dispatch(
+            SimpleNamespace(event_type="modified", src_path=str(target), dest_path="")
+        )
+
+        self.assertTrue(self.event.is_set())
+
+    def test_pending_change_skips_matching(self):
+        """Further events while a change is pending are not even examined."""
+        self.event.set()
+        with mock.patch.object(self.watcher, "_is_config") as is_config:
+            self._dispatch("modified", self.config_path)
+        is_config.assert_not_called()
+        self.assertTrue(self.event.is_set())
+
+    def test_other_files_are_ignored(self):
+        """Events for neighbouring files in ~/.config do not trigger."""
+        self._dispatch("modified", self.dir / "kdeglobals")
+        self._dispatch("created", self.dir / "sub" / "clockwork-orange.yml")
+        self._dispatch("deleted", self.config_path)
+        self.assertFalse(self.event.is_set())
+
+
 if __name__ == "__main__":
     unittest.main()
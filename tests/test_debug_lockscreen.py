@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Tests for the --debug-lockscreen report.
+
+The report is output the user asked for, so it has to appear at the default
+log level, with neither CO_DEBUG nor `debug: true` set: the kscreenlockerrc
+groups and keys, the current lock screen and greeter wallpapers, or a note
+that the file does not exist.
+"""
+import io
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import clockwork_orange_main as co  # loaded by conftest.py
+
+KSCREENLOCKERRC = """\
+[Greeter]
+wallpaper=file:///greeter.jpg
+
+[Greeter][Wallpaper][org.kde.image][General]
+Image=file:///lock.jpg
+"""
+
+
+class TestDebugLockscreenReport(unittest.TestCase):
+    """debug_lockscreen_config prints whatever the debug setting."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.home = Path(self._tmp.name)
+        (self.home / ".config").mkdir()
+        self.rc_path = self.home / ".config" / "kscreenlockerrc"
+
+        for patcher in (
+            mock.patch.object(co.Path, "home", return_value=self.home),
+            mock.patch.dict(os.environ, {"CO_DEBUG": ""}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        co._apply_debug_setting({})
+        self.addCleanup(co._apply_debug_setting, {})
+        self.assertFalse(co.log.isEnabledFor(logging.DEBUG))
+
+    def _report(self):
+        with redirect_stdout(io.StringIO()) as out:
+            co.debug_lockscreen_config()
+        return out.getvalue()
+
+    def test_report_is_printed_without_debug_enabled(self):
+        """Sections and both wallpapers are shown at the default level."""
+        self.rc_path.write_text(KSCREENLOCKERRC)
+
+        report = self._report()
+
+        self.assertIn("Configuration sections found:", report)
+        self.assertIn("Current lock screen wallpaper: file:///lock.jpg", report)
+        self.assertIn("Main Greeter wallpaper: file:///greeter.jpg", report)
+
+    def test_missing_file_is_reported(self):
+        """Without a kscreenlockerrc the user is told so."""
+        self.assertIn("does not exist", self._report())
+
+    def test_main_prints_report_without_loading_config(self):
+        """--debug-lockscreen reports before, and without, the config load."""
+        self.rc_path.write_text(KSCREENLOCKERRC)
+
+        argv = ["clockwork-orange", "--debug-lockscreen"]
+        with mock.patch.object(sys, "argv", argv):
+            with mock.patch.object(co, "load_config_file") as load:
+                with redirect_stdout(io.StringIO()) as out:
+                    co.main()
+
+        load.assert_not_called()
+        self.assertIn("Current lock screen wallpaper", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
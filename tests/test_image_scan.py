@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""Tests for finding wallpaper candidates in source directories.
+
+Covers the cached scandir listing (_scan_images), the extension-then-header
+image check (is_image_file), and how random images are drawn from several
+sources, including empty, missing and too-small ones.
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import clockwork_orange_main as co  # loaded by conftest.py
+
+
+class TestScanImages(unittest.TestCase):
+    """_scan_images lists image files and caches by directory mtime."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        co._DIR_CACHE.clear()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _touch(self, name):
+        path = self.dir / name
+        path.write_bytes(b"")
+        return path
+
+    def test_returns_only_image_files(self):
+        """Non-image files and directories with image-like names are skipped."""
+        expected = {self._touch("a.jpg"), self._touch("b.PNG"), self._touch("c.webp")}
+        self._touch("notes.txt")
+        self._touch("no_extension")
+        (self.dir / "folder.jpg").mkdir()
+
+        found = set(co._scan_images(self.dir))
+
+        self.assertEqual(found, expected)
+
+    def test_empty_directory(self):
+        """An empty directory yields no candidates."""
+        self.assertEqual(list(co._scan_images(self.dir)), [])
+
+    def test_random_image_comes_from_directory(self):
+        """get_random_image_from_directory picks one of the scanned images."""
+        images = {self._touch("one.jpeg"), self._touch("two.gif")}
+        self._touch("readme.md")
+
+        self.assertIn(co.get_random_image_from_directory(self.dir), images)
+
+    def test_unchanged_directory_reuses_cached_scan(self):
+        """A second scan of an unchanged directory returns the cached result."""
+        self._touch("a.jpg")
+
+        first = co._scan_images(self.dir)
+        second = co._scan_images(self.dir)
+
+        self.assertIs(first, second)
+
+    def test_added_file_invalidates_cache(self):
+        """Adding a file bumps the directory mtime and forces a rescan."""
+        self._touch("a.jpg")
+        co._scan_images(self.dir)
+
+        added = self._touch("b.png")
+
+        self.assertIn(added, co._scan_images(self.dir))
+
+
+class TestIsImageFile(unittest.TestCase):
+    """is_image_file trusts known extensions and sniffs the rest."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_known_extension_is_accepted_without_reading(self):
+        """A listed extension is enough, whatever the contents."""
+        path = self.dir / "photo.JPG"
+        path.write_bytes(b"")
+
+        self.assertTrue(co.is_image_file(path))
+
+    def test_unlisted_extension_is_sniffed(self):
+        """Files with other extensions are accepted by their header bytes."""
+        tif = self.dir / "scan.tif"
+        tif.write_bytes(b"II*\x00" + b"\x00" * 8)
+        webp = self.dir / "download"
+        webp.write_bytes(b"RIFF\x10\x00\x00\x00WEBPVP8 ")
+
+        self.assertTrue(co.is_image_file(tif))
+        self.assertTrue(co.is_image_file(webp))
+
+    def test_non_image_is_rejected(self):
+        """Text files and directories are not images."""
+        notes = self.dir / "notes.txt"
+        notes.write_text("hello")
+
+        self.assertFalse(co.is_image_file(notes))
+        self.assertFalse(co.is_image_file(self.dir))
+
+
+class TestNRandomImagesFromSources(unittest.TestCase):
+    """Random picks across sources, with repeats only when images run out."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        co._DIR_CACHE.clear()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_source(self, name, count):
+        source = self.root / name
+        source.mkdir()
+        for i in range(count):
+            (source / f"{i}.jpg").write_bytes(b"")
+        return source
+
+    def test_images_are_unique_when_enough_exist(self):
+        """n images are returned without repeats across sources."""
+        a = self._make_source("a", 2)
+        b = self._make_source("b", 1)
+
+        images = co.get_n_random_images_from_sources([a, b], 3)
+
+        self.assertEqual(len(images), 3)
+        self.assertEqual(len(set(images)), 3)
+
+    def test_too_few_images_are_repeated(self):
+        """With fewer images than slots, every slot is still filled."""
+        a = self._make_source("a", 1)
+
+        images = co.get_n_random_images_from_sources([a], 3)
+
+        self.assertEqual(images, [a / "0.jpg"] * 3)
+
+    def test_sources_without_images_raise(self):
+        """Sources with no images at all raise ValueError."""
+        empty = self._make_source("empty", 0)
+
+        with self.assertRaises(ValueError):
+            co.get_n_random_images_from_sources([empty], 1)
+
+    def test_missing_sources_are_skipped(self):
+        """A source that does not exist is ignored when others have images."""
+        full = self._make_source("full", 1)
+
+        images = co.get_n_random_images_from_sources([self.root / "gone", full], 1)
+
+        self.assertEqual(images, [full / "0.jpg"])
+
+    def test_only_missing_sources_raise(self):
+        """With no existing source at all, ValueError is raised."""
+        with self.assertRaisesRegex(ValueError, "No valid sources"):
+            co.get_n_random_images_from_sources([self.root / "gone"], 1)
+
+    def test_random_image_skips_empty_sources(self):
+        """get_random_image_from_sources only picks from sources with images."""
+        empty = self._make_source("empty", 0)
+        full = self._make_source("full", 2)
+
+        for _ in range(10):
+            self.assertEqual(
+                co.get_random_image_from_sources([empty, full]).parent, full
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
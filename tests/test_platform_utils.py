@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""Tests for the KDE lock screen helpers in platform_utils.
+
+delete_kscreenlocker_keys removes keys case-sensitively from plain and nested
+kscreenlockerrc groups without creating a missing file. Setting the lock
+screen image only rewrites that one line, keeps symlinks, and leaves files
+using KConfig markers it doesn't implement to kwriteconfig6. The screen locker
+reload calls configure() on the right D-Bus interface, falling back to qdbus6
+when the in-process call fails.
+"""
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import platform_utils
+
+KSCREENLOCKERRC = """\
+[Daemon]
+LockOnResume=true
+lockonresume=true
+
+[Greeter]
+Theme=breeze
+wallpaper=old
+
+[Greeter][Wallpaper][org.kde.image][General]
+Image=file:///a.jpg
+image=file:///b.jpg
+"""
+
+
+class TestDeleteKscreenlockerKeys(unittest.TestCase):
+    """delete_kscreenlocker_keys edits only the named keys."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": self._tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config_path = Path(self._tmp.name) / "kscreenlockerrc"
+
+    def test_removes_only_the_named_keys(self):
+        """Case-sensitive deletes across plain and nested groups."""
+        self.config_path.write_text(KSCREENLOCKERRC)
+
+        ok = platform_utils.delete_kscreenlocker_keys(
+            [
+                ("Daemon", "lockonresume"),
+                ("Greeter", "wallpaper"),
+                (platform_utils.KSCREENLOCKER_IMAGE_GROUP, "image"),
+                ("Missing", "key"),
+            ]
+        )
+
+        self.assertTrue(ok)
+        text = self.config_path.read_text()
+        self.assertIn("LockOnResume=true", text)
+        self.assertNotIn("lockonresume", text)
+        self.assertNotIn("wallpaper=old", text)
+        self.assertIn("Image=file:///a.jpg", text)
+        self.assertNotIn("image=file:///b.jpg", text)
+
+    def test_missing_file_is_not_created(self):
+        """Without a kscreenlockerrc there is nothing to clean."""
+        self.assertTrue(platform_utils.delete_kscreenlocker_keys([("Daemon", "timeout")]))
+        self.assertFalse(self.config_path.exists())
+
+
+class TestWriteKscreenlockerImage(unittest.TestCase):
+    """_write_kscreenlocker_image edits the Image line and nothing else."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = Path(self._tmp.name)
+        patcher = mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": self._tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config_path = self.config_dir / "kscreenlockerrc"
+
+    def test_other_lines_are_kept_byte_for_byte(self):
+        """Comments, CRLF endings and KConfig markers survive the edit."""
+        original = (
+            "# managed by hand\r\n"
+            "[Daemon]\r\n"
+            "Timeout[$e]=$TIMEOUT\r\n"
+            "\r\n"
+            f"[{platform_utils.KSCREENLOCKER_IMAGE_GROUP}]\r\n"
+            "Image=file:///old.jpg\r\n"
+            "PreviewImage=file:///old.jpg\r\n"
+        )
+        self.config_path.write_bytes(original.encode())
+
+        self.assertTrue(platform_utils._write_kscreenlocker_image("file:///new.jpg"))
+
+        self.assertEqual(
+            self.config_path.read_bytes().decode(),
+            original.replace("Image=file:///old.jpg", "Image=file:///new.jpg", 1),
+        )
+
+    def test_missing_group_is_appended(self):
+        """A file without the wallpaper group gains it at the end."""
+        self.config_path.write_text("[Daemon]\nAutolock=false")
+
+        self.assertTrue(platform_utils._write_kscreenlocker_image("file:///a b.jpg"))
+
+        self.assertEqual(
+            self.config_path.read_text(),
+            "[Daemon]\nAutolock=false\n\n"
+            f"[{platform_utils.KSCREENLOCKER_IMAGE_GROUP}]\nImage=file:///a b.jpg\n",
+        )
+
+    def test_symlinked_file_stays_a_symlink(self):
+        """The link's target is updated instead of being replaced by a file."""
+        target = self.config_dir / "dotfiles" / "kscreenlockerrc"
+        target.parent.mkdir()
+        target.write_text("[Greeter]\nTheme=breeze\n")
+        self.config_path.symlink_to(target)
+
+        self.assertTrue(platform_utils._write_kscreenlocker_image("file:///a.jpg"))
+
+        self.assertTrue(self.config_path.is_symlink())
+        self.assertIn("Image=file:///a.jpg", target.read_text())
+        self.assertEqual(os.listdir(target.parent), ["kscreenlockerrc"])
+
+    def test_kconfig_markers_fall_back_to_kwriteconfig(self):
+        """Immutable groups and [$e] keys are left for kwriteconfig6."""
+        group = platform_utils.KSCREENLOCKER_IMAGE_GROUP
+        for text in (
+            f"[{group}][$i]\nImage=file:///locked.jpg\n",
+            f"[{group}]\nImage[$e]=$HOME/a.jpg\n",
+        ):
+            self.config_path.write_text(text)
+
+            with redirect_stdout(io.StringIO()):
+                written = platform_utils._write_kscreenlocker_image("file:///b.jpg")
+            self.assertFalse(written)
+            self.assertEqual(self.config_path.read_text(), text)
+
+
+class TestReloadScreensaverConfig(unittest.TestCase):
+    """kscreenlocker reload over D-Bus, with the qdbus6 fallback."""
+
+    def setUp(self):
+        for name, kwargs in (
+            ("_get_session_bus", {"return_value": object()}),
+            ("_dbus_call", {"return_value": True}),
+        ):
+            patcher = mock.patch.object(platform_utils, name, **kwargs)
+            setattr(self, name.lstrip("_"), patcher.start())
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(platform_utils.subprocess, "Popen")
+        self.popen = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_calls_configure_on_the_kde_interface(self):
+        """configure() lives on org.kde.screensaver, not the freedesktop API."""
+        platform_utils._reload_screensaver_config_linux()
+
+        self.dbus_call.assert_called_once_with(
+            "org.freedesktop.ScreenSaver", "/ScreenSaver", "org.kde.screensaver.configure"
+        )
+        self.popen.assert_not_called()
+
+    def test_failed_dbus_call_falls_back_to_qdbus6(self):
+        """An error reply over jeepney still gets the reload through qdbus6."""
+        self.dbus_call.return_value = False
+
+        platform_utils._reload_screensaver_config_linux()
+
+        self.assertEqual(self.popen.call_args.args[0][0], "qdbus6")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Tests for PluginManager discovery and plugin module loading.
+
+The bundled plugins directory is discovered, each plugin module is imported
+at most once no matter how many schema/description lookups follow, and
+asking for a plugin that was never discovered raises ValueError.
+"""
+import unittest
+from unittest import mock
+
+import plugin_manager
+
+
+class TestPluginModuleLoading(unittest.TestCase):
+    """Discovery and cached loading of plugin modules."""
+
+    def setUp(self):
+        self.pm = plugin_manager.PluginManager()
+
+    def test_bundled_plugins_are_discovered(self):
+        """The shipped plugins directory yields the local plugin."""
+        self.assertIn("local", self.pm.get_available_plugins())
+
+    def test_schema_and_description_load_the_module_once(self):
+        """Repeated metadata lookups reuse the loaded plugin module."""
+        real_spec = plugin_manager.importlib.util.spec_from_file_location
+        with mock.patch.object(
+            plugin_manager.importlib.util,
+            "spec_from_file_location",
+            side_effect=real_spec,
+        ) as spec:
+            schema = self.pm.get_plugin_schema("local")
+            description = self.pm.get_plugin_description("local")
+            self.pm.get_plugin_schema("local")
+
+        self.assertIn("path", schema)
+        self.assertTrue(description)
+        self.assertEqual(spec.call_count, 1)
+
+    def test_unknown_plugin_raises(self):
+        """Loading a plugin that was not discovered is an error."""
+        with self.assertRaises(ValueError):
+            self.pm._load_plugin_module("does_not_exist")
+
+
+if __name__ == "__main__":
+    unittest.main()